@@ -2,7 +2,7 @@
 ## Errors
 from .star_shift import ShiftError, ShiftFieldError, ShiftTypeMismatchError, UnknownShiftTypeError
 ## Metadata
-from .star_shift import Missing, ShiftConfig, DEFAULT_SHIFT_CONFIG, ShiftInfo, ShiftFieldInfo, ShiftField
+from .star_shift import Missing, ShiftConfig, DEFAULT_SHIFT_CONFIG, ShiftInfo, ShiftFieldInfo, ShiftFieldHandlers, ShiftField
 ## Type Aliases
 from .star_shift import ShiftSimpleTransformer, ShiftAdvancedTransformer, ShiftTransformer
 from .star_shift import ShiftSimpleValidator, ShiftAdvancedValidator, ShiftValidator
@@ -5,21 +5,29 @@
 from __future__ import annotations
 
 # Data containers
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
 
 # Check types in validation
 from typing import get_origin, get_args, get_type_hints, Any, Union, ForwardRef, Type, Optional, Literal, TypeAlias
 from collections.abc import Iterable, Callable
+from types import UnionType
 
 # Evaluate regex
 import re
 
 # Evaluate forward references and check function signatures
-import inspect, sys
+import inspect, sys, builtins
 
 # Creating copies of values when running repr and serialize
 import copy
 
+# Encoding serialized values in to_json - orjson is optional and used when installed
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # endregion
 # region Global Registers & Defaults
@@ -30,9 +38,28 @@ import copy
 #   Leave override here in case users want an easy way to add more static types
 _shift_types: dict[Type, ShiftType] = {}
 
+# Resolved shift types registers (cache)
+#   Maps any hint passed to get_shift_type to its ShiftType, cleared whenever _shift_types changes
+_shift_type_cache: dict[Any, ShiftType | None] = {}
+
 # Resolved forward refs registers (cache)
 _resolved_forward_refs: dict[str, Type] = {}
 
+# Type hint origin and args registers (cache)
+#   get_origin and get_args are pure functions of the hint, but run on every field and element
+#   Keyed by id, since typing compares Union and Literal args by equality (Union[A, B] == Union[B, A]),
+#   with the hint kept in the entry so its id can't be reused
+_type_origins_cache: dict[int, tuple[Any, Any]] = {}
+_type_args_cache: dict[int, tuple[Any, tuple]] = {}
+
+# Class type hints registers (cache)
+#   get_type_hints walks the MRO and evaluates string annotations, so only do it once per class
+_type_hints_cache: dict[Type, dict[str, Any]] = {}
+
+# Copyable types registers (cache)
+#   copy.copy looks __copy__ up on the type, so whether a val needs copying only depends on its type
+_type_has_copy_cache: dict[Type, bool] = {}
+
 # Global info registers (metadata)
 #   By leaving this here we can keep global references of static class elements like config and decorated class defs
 _shift_info_registry: dict[Type, ShiftInfo] = {}
@@ -124,7 +151,7 @@ class Missing:
     def __bool__(self) -> bool:
         return False
 
-@dataclass
+@dataclass(slots=True)
 class ShiftConfig:
     """Configuration for shift phases
 
@@ -146,9 +173,11 @@ class ShiftConfig:
 
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, ShiftConfig):
             return False
-        return serialize(self) == serialize(other)
+        return self._as_tuple() == other._as_tuple()
 
     def __ne__(self, other):
         return not self == other
@@ -188,6 +217,10 @@ class ShiftConfig:
             result['include_private_fields_in_serialization'] = self.include_private_fields_in_serialization
         return result
 
+    def _as_tuple(self) -> tuple[bool, ...]:
+        return (self.do_processing, self.fail_fast, self.try_coerce_types, self.allow_private_field_setting,
+                self.include_default_fields_in_serialization, self.include_private_fields_in_serialization)
+
     def __copy__(self) -> ShiftConfig:
         return ShiftConfig(
             fail_fast=self.fail_fast,
@@ -200,7 +233,7 @@ class ShiftConfig:
 
 DEFAULT_SHIFT_CONFIG = ShiftConfig()
 
-@dataclass
+@dataclass(slots=True)
 class ShiftInfo:
     """Data class for storing validation info
 
@@ -222,6 +255,14 @@ class ShiftInfo:
         transform_errors (list[ShiftFieldError]): List of errors accumulated during transform
         validation_errors (list[ShiftFieldError]): List of errors accumulated during validation
         set_errors (list[ShiftFieldError]): List of errors accumulated during set
+        handlers (dict[str, ShiftFieldHandlers]): Dict of field names to all decorator functions for that field, built once per class and rebuilt if any decorator dict/list above is replaced or edited
+        handlers_source (tuple): Copies of the decorator dicts/lists handlers was built from
+        fields_source (list[ShiftFieldInfo] | None): The fields list simple_output was built for
+        private_field_names (frozenset[str]): Set of private field names, built once per class
+        config_repr (str | None): repr of shift_config when it is included in repr/serialize output, else None; Rebuilt when shift_config changes
+        config_serialized (dict[str, Any] | None): Serialized shift_config when it is included in repr/serialize output, else None; Rebuilt when shift_config changes
+        config_source (ShiftConfig | None): Copy of the shift_config config_repr and config_serialized were built from
+        simple_output (bool): Whether repr/serialize can skip per-field dispatch (only base type fields, no ShiftFields, no repr/serializer functions); Rebuilt when fields or handlers change
     """
     instance: Any
     model_name: str
@@ -240,13 +281,21 @@ class ShiftInfo:
     transform_errors: list[ShiftFieldError]
     validation_errors: list[ShiftFieldError]
     set_errors: list[ShiftFieldError]
+    handlers: dict[str, ShiftFieldHandlers] = dataclass_field(default_factory=dict, compare=False)
+    handlers_source: tuple = dataclass_field(default=(), compare=False)
+    fields_source: list[ShiftFieldInfo] | None = dataclass_field(default=None, compare=False)
+    private_field_names: frozenset[str] = dataclass_field(default=frozenset(), compare=False)
+    config_repr: str | None = dataclass_field(default=None, compare=False)
+    config_serialized: dict[str, Any] | None = dataclass_field(default=None, compare=False)
+    config_source: ShiftConfig | None = dataclass_field(default=None, compare=False)
+    simple_output: bool = dataclass_field(default=False, compare=False)
 
 
 
     def __repr__(self) -> str:
         return f'ShiftInfo for `{self.model_name}`'
 
-@dataclass
+@dataclass(slots=True)
 class ShiftFieldInfo:
     """Data class for storing validation info
 
@@ -255,17 +304,47 @@ class ShiftFieldInfo:
         typ (Any): Type hint of the field; Default: Missing
         val (Any): Value of the field; Default: Missing
         default (Any): Default value of the field; Default: Missing
+        shift_type (ShiftType | None): Cached ShiftType of typ, set when the class is registered; Default: None
+        is_private (bool): Whether the field name is private (starts with `_`), derived from name
     """
     name: str
     typ: Any = Missing
     val: Any = Missing
     default: Any = Missing
+    shift_type: ShiftType | None = dataclass_field(default=None, compare=False, repr=False)
+    is_private: bool = dataclass_field(init=False, compare=False, repr=False)
 
-
+    def __post_init__(self) -> None:
+        self.is_private = self.name.startswith("_")
 
     def __repr__(self) -> str:
         return f'ShiftFieldInfo for `{self.name}` of type `{self.typ}`'
 
+@dataclass(slots=True)
+class ShiftFieldHandlers:
+    """Data class for storing all decorator functions of a single field
+
+    Attributes:
+        pre_transformer (ShiftTransformer | None): Pre-transformer of the field; Default: None
+        pre_transformer_skip (bool): Whether to skip after the pre-transformer runs; Default: False
+        transformer (ShiftTransformer | None): Transformer of the field; Default: None
+        pre_validator (ShiftValidator | None): Pre-validator of the field; Default: None
+        pre_validator_skip (bool): Whether to skip after the pre-validator runs; Default: False
+        validator (ShiftValidator | None): Validator of the field; Default: None
+        setter (ShiftSetter | None): Setter of the field; Default: None
+        repr (ShiftRepr | None): Repr of the field; Default: None
+        serializer (ShiftSerializer | None): Serializer of the field; Default: None
+    """
+    pre_transformer: ShiftTransformer | None = None
+    pre_transformer_skip: bool = False
+    transformer: ShiftTransformer | None = None
+    pre_validator: ShiftValidator | None = None
+    pre_validator_skip: bool = False
+    validator: ShiftValidator | None = None
+    setter: ShiftSetter | None = None
+    repr: ShiftRepr | None = None
+    serializer: ShiftSerializer | None = None
+
 @dataclass
 class ShiftField:
     """Class for simple inline validation checks
@@ -517,17 +596,33 @@ class ShiftType:
     serializer: ShiftSerializer = _shift_base_serializer_wrapper
 
 def get_shift_type(typ: Any) -> ShiftType | None:
-    # If in types, return the type
-    if hasattr(typ, "__hash__") and typ in _shift_types:
-        return _shift_types[typ]
+    # Check the resolved type cache first - unhashable types (list args, etc.) raise TypeError and skip caching
+    try:
+        shift_typ = _shift_type_cache.get(typ, Missing)
+    except TypeError:
+        return _resolve_shift_type(typ)
+    if shift_typ is Missing:
+        shift_typ = _shift_type_cache[typ] = _resolve_shift_type(typ)
+    return shift_typ
+
+def _resolve_shift_type(typ: Any) -> ShiftType | None:
+    # If in types, return the type - unhashable types (list args, etc.) raise TypeError and fall through
+    try:
+        if typ in _shift_types:
+            return _shift_types[typ]
+    except TypeError:
+        pass
 
     # If origin in types, return the type
-    origin = get_origin(typ)
-    if hasattr(origin, "__hash__") and origin in _shift_types:
-        return _shift_types[origin]
+    origin = _get_origin(typ)
+    try:
+        if origin in _shift_types:
+            return _shift_types[origin]
+    except TypeError:
+        pass
 
     # If type is a ForwardRef, return the type
-    if isinstance(typ, ForwardRef) or isinstance(typ, str):
+    if isinstance(typ, (ForwardRef, str)):
         return _shift_types[ForwardRef]
 
     # If type is a ShiftModel subclass, return shift type
@@ -618,9 +713,10 @@ def shift_serializer(*fields: str) -> Callable[[ShiftSerializer], ShiftSerialize
 
 def shift_function_wrapper(field: ShiftFieldInfo, info: ShiftInfo, func: Callable) -> Any | None:
     """Wrapper to automatically determine if the function is advanced or not, and call appropriately, returning the result"""
-    # Check cache first
-    if func in _shift_functions:
-        if _shift_functions[func]:
+    # Check cache first - a single get instead of a contains + getitem pair
+    advanced = _shift_functions.get(func, Missing)
+    if advanced is not Missing:
+        if advanced:
             return func(info.instance, field, info)
         return func(info.instance, field.val)
 
@@ -643,8 +739,9 @@ def shift_function_wrapper(field: ShiftFieldInfo, info: ShiftInfo, func: Callabl
 def shift_init_function_wrapper(info: ShiftInfo, func: Callable) -> None:
     """Wrapper to automatically determine if the init function is advanced or not, and call appropriately"""
     # Check cache first
-    if func in _shift_init_functions:
-        if _shift_init_functions[func]:
+    advanced = _shift_init_functions.get(func, Missing)
+    if advanced is not Missing:
+        if advanced:
             return func(info.instance, info)
         return func(info.instance)
 
@@ -711,6 +808,114 @@ def _validate_callable_return_type(return_type: Any, sig: Any, shift_info: Shift
         except ShiftTypeMismatchError as e:
             raise ShiftTypeMismatchError(f"could not check types for return annotation: {e}")
 
+def _get_origin(typ: Any) -> Any:
+    """Cached get_origin, keyed by the identity of typ"""
+    entry = _type_origins_cache.get(id(typ))
+    if entry is not None and entry[0] is typ:
+        return entry[1]
+    origin = get_origin(typ)
+    _type_origins_cache[id(typ)] = (typ, origin)
+    return origin
+
+def _get_args(typ: Any) -> tuple:
+    """Cached get_args, keyed by the identity of typ"""
+    entry = _type_args_cache.get(id(typ))
+    if entry is not None and entry[0] is typ:
+        return entry[1]
+    args = get_args(typ)
+    _type_args_cache[id(typ)] = (typ, args)
+    return args
+
+def _has_copy(val: Any) -> bool:
+    """Cached check for whether the type of val defines __copy__"""
+    typ = type(val)
+    has_copy = _type_has_copy_cache.get(typ)
+    if has_copy is None:
+        has_copy = _type_has_copy_cache[typ] = hasattr(typ, '__copy__')
+    return has_copy
+
+def _is_shift_model(val: Any) -> bool:
+    """Returns True if val is a ShiftModel instance or subclass, without raising for non-class vals"""
+    if isinstance(val, ShiftModel):
+        return True
+    if not isinstance(val, type):
+        return False
+    try:
+        return issubclass(val, ShiftModel)
+    except Exception:
+        return False
+
+def _isinstance_types(args: tuple) -> tuple | None:
+    """
+    Returns a tuple of types to isinstance check vals against when every arg is a base type, None, or Any, None otherwise.
+    Any maps to object, so callers must also reject Missing vals.
+    """
+    types = []
+    for arg in args:
+        shift_typ = get_shift_type(arg)
+        if shift_typ is None:
+            return None
+        if shift_typ.validator is shift_base_type_validator:
+            types.append(arg)
+        elif shift_typ.validator is shift_none_type_validator:
+            types.append(type(None))
+        elif shift_typ.validator is shift_any_type_validator:
+            types.append(object)
+        else:
+            return None
+    return tuple(types)
+
+def _as_is_types(args: tuple, func_name: str) -> tuple | None:
+    """
+    Returns a tuple of types, one per arg, whose isinstance-matching vals come back unchanged from the func_name ShiftType function, None otherwise.
+    Any maps to object, so callers must also reject Missing vals.
+    """
+    types = []
+    for arg in args:
+        shift_typ = get_shift_type(arg)
+        if shift_typ is None:
+            return None
+        func = getattr(shift_typ, func_name)
+        if func is getattr(base_shift_type, func_name):
+            types.append(arg)
+        elif func is getattr(none_shift_type, func_name):
+            types.append(type(None))
+        elif func is getattr(any_shift_type, func_name):
+            types.append(object)
+        else:
+            return None
+    return tuple(types)
+
+def _empty_args_true(field_info: ShiftFieldInfo) -> bool:
+    return True
+
+def _empty_args_val(field_info: ShiftFieldInfo) -> Any:
+    return field_info.val
+
+def _empty_args_repr(field_info: ShiftFieldInfo) -> str:
+    return repr(field_info.val)
+
+def _shift_type_args(empty_result: Callable[[ShiftFieldInfo], Any]) -> Callable[[Callable], Callable]:
+    """
+    Decorator for shift type functions that depend on field_info.typ args.
+    Returns empty_result(field_info) when the type has no args, else calls the function with the args appended.
+    """
+
+    def decorator(func):
+        def wrapper(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+            args = _get_args(field_info.typ)
+            if not args:
+                return empty_result(field_info)
+            return func(instance, field_info, shift_info, args)
+
+        # Don't use functools.wraps, __wrapped__ would make inspect.signature report the inner 4-param signature
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__module__ = func.__module__
+        return wrapper
+    return decorator
+
 ## Transform
 ############
 
@@ -754,16 +959,13 @@ def shift_any_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_
         raise ShiftTypeMismatchError(f"expected a value, got `MISSING`")
     return field_info.val
 
-def shift_one_of_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_one_of_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to transform field_info.val for each type in field_info.typ.args, returning the first successful transformed value.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # One arg must match
     for arg in args:
         try:
@@ -773,31 +975,25 @@ def shift_one_of_type_transformer(instance: Any, field_info: ShiftFieldInfo, shi
             pass
     raise ShiftTypeMismatchError(f"expected one of types `{args}`, got `{_get_type_name(field_info.val)}`")
 
-def shift_one_of_val_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_one_of_val_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Returns field_info.val if val is in field_info.typ.args.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # One val must match
     if not field_info.val in args:
         raise ShiftTypeMismatchError(f"expected one of values `{args}`, got `{field_info.val}`")
     return field_info.val
 
-def shift_all_of_single_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_single_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to, for all field_info.val, transform field_info.val[i] as the type field_info.typ.args[0].
     Raises ShiftTypeMismatchError if any field_info.val is a different type than field_info.typ.args[0].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Must have one arg and val must be list-like
     if len(args) != 1:
         raise ShiftTypeMismatchError(f"expected one type arg, got `{args}`")
@@ -809,29 +1005,30 @@ def shift_all_of_single_type_transformer(instance: Any, field_info: ShiftFieldIn
     if not indexable:
         field_info.val = list(field_info.val)
 
-    # All values must be of type args[0]
-    for i, val in enumerate(field_info.val):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(args[0])}[{i}]", args[0], val)
-        try:
-            field_info.val[i] = shift_type_transformer(instance, tmp_field_info, shift_info)
-        except ShiftTypeMismatchError:
-            raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
+    # All values must be of type args[0], vals that transform as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'transformer')
+    if types is None or not all(val is not Missing and isinstance(val, types) for val in field_info.val):
+        arg = args[0]
+        name = f"{field_info.name}.{_get_type_name(arg)}"
+        for i, val in enumerate(field_info.val):
+            tmp_field_info = ShiftFieldInfo(f"{name}[{i}]", arg, val)
+            try:
+                field_info.val[i] = shift_type_transformer(instance, tmp_field_info, shift_info)
+            except ShiftTypeMismatchError:
+                raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
 
     # Convert back typ if needed
     if not indexable:
-        field_info.val = get_origin(field_info.typ)(field_info.val)
+        field_info.val = _get_origin(field_info.typ)(field_info.val)
     return field_info.val
 
-def shift_all_of_many_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_many_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to, for all field_info.val, transform field_info.val[i] as the type field_info.typ.args[i].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[i].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Val must be list-like, and must have same len as args
     if not isinstance(field_info.val, Iterable):
         raise ShiftTypeMismatchError(f"expected value to be list-like, got `{field_info.val}`")
@@ -843,35 +1040,43 @@ def shift_all_of_many_type_transformer(instance: Any, field_info: ShiftFieldInfo
     if not indexable:
         field_info.val = list(field_info.val)
 
-    # All values must be of type args[i]
-    for i, (val, arg) in enumerate(zip(field_info.val, args)):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
-        try:
-            field_info.val[i] = shift_type_transformer(instance, tmp_field_info, shift_info)
-        except ShiftTypeMismatchError as e:
-            raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
+    # All values must be of type args[i], vals that transform as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'transformer')
+    if types is None or not all(val is not Missing and isinstance(val, typ) for val, typ in zip(field_info.val, types)):
+        for i, (val, arg) in enumerate(zip(field_info.val, args)):
+            tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
+            try:
+                field_info.val[i] = shift_type_transformer(instance, tmp_field_info, shift_info)
+            except ShiftTypeMismatchError as e:
+                raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
 
     # Convert back typ if needed
     if not indexable:
-        field_info.val = get_origin(field_info.typ)(field_info.val)
+        field_info.val = _get_origin(field_info.typ)(field_info.val)
     return field_info.val
 
-def shift_all_of_pair_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_pair_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to, for all field_info.val, transform field_info.val[i].key as field_info.typ.args[0] and transform field_info.val[i].val as field_info.typ.args[1].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[0] or field_info.typ.args[1].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Must be dict-like
     if not hasattr(field_info.val, "items"):
         raise ShiftTypeMismatchError(f"expected value to be dict-like, got `{field_info.val}`")
 
+    # Key-val pairs that transform as themselves can be copied directly
+    key_types = _as_is_types(args[:1], 'transformer')
+    val_types = _as_is_types(args[1:2], 'transformer') if len(args) > 1 else (object,)
+    if key_types is not None and val_types is not None and all(
+            key is not Missing and val is not Missing and isinstance(key, key_types) and isinstance(val, val_types)
+            for key, val in field_info.val.items()):
+        return dict(field_info.val.items())
+
     # All key-val pairs must match type
     new_val = {}
+    has_val_typ = len(args) > 1
     for i, (key, val) in enumerate(field_info.val.items()):
         try:
             tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(key)}", args[0], key)
@@ -880,7 +1085,7 @@ def shift_all_of_pair_type_transformer(instance: Any, field_info: ShiftFieldInfo
             raise ShiftTypeMismatchError(f"expected key at index {i} to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(key)}`: {e}")
 
         try:
-            if len(args) > 1:
+            if has_val_typ:
                 tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(val)}", args[1], val)
                 new_val[key] = shift_type_transformer(instance, tmp_field_info, shift_info)
             else:
@@ -890,16 +1095,13 @@ def shift_all_of_pair_type_transformer(instance: Any, field_info: ShiftFieldInfo
 
     return new_val
 
-def shift_callable_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_callable_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to check if value is callable and has a readable signature.
     Raises ShiftTypeMismatchError if value is not callable or has an unreadable signature.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Value must be callable
     if not callable(field_info.val):
         raise ShiftTypeMismatchError(f"expected callable, got `{_get_type_name(field_info.val)}`")
@@ -919,8 +1121,10 @@ def shift_forward_ref_type_transformer(instance: Any, field_info: ShiftFieldInfo
     """
 
     # Check cache first
-    if field_info.typ in _resolved_forward_refs:
-        field_info.typ = _resolved_forward_refs[field_info.typ]
+    resolved = _resolved_forward_refs.get(field_info.typ)
+    if resolved is not None:
+        field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_transformer(instance, field_info, shift_info)
 
     # Attempt to resolve the forward ref
@@ -928,6 +1132,7 @@ def shift_forward_ref_type_transformer(instance: Any, field_info: ShiftFieldInfo
         resolved = resolve_forward_ref(field_info.typ, shift_info)
         register_forward_ref(field_info.typ, resolved)
         field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_transformer(instance, field_info, shift_info)
     except Exception as e:
         raise ShiftTypeMismatchError(f"could not resolve forward reference `{field_info.typ}`: {e}")
@@ -938,11 +1143,8 @@ def shift_shift_type_transformer(instance: Any, field_info: ShiftFieldInfo, shif
     Raises ShiftTypeMismatchError if the field.val is not a ShiftModel subclass, or class construction fails.
     """
 
-    try:
-        if isinstance(field_info.val, ShiftModel) or issubclass(field_info.val, ShiftModel):
-            return field_info.val
-    except Exception:
-        pass
+    if _is_shift_model(field_info.val):
+        return field_info.val
     if isinstance(field_info.val, dict):
         return field_info.val
     raise ShiftTypeMismatchError(f"expected ShiftModel subclass or dict, got `{_get_type_name(field_info.val)}`")
@@ -977,10 +1179,16 @@ def shift_type_transformer(instance: Any, field_info: ShiftFieldInfo, shift_info
     Raises UnknownShiftTypeError if the field type is not registered in the ShiftTypes registry.
     """
 
-    shift_typ = get_shift_type(field_info.typ)
+    shift_typ = field_info.shift_type
+    if shift_typ is None:
+        shift_typ = get_shift_type(field_info.typ)
     if shift_typ is None:
         raise UnknownShiftTypeError(f"has unknown type `{field_info.typ}`")
-    return shift_function_wrapper(field_info, shift_info, shift_typ.transformer)
+    func = shift_typ.transformer
+    # Builtin type functions are advanced, so call them directly once their signature is cached
+    if _shift_functions.get(func) is True:
+        return func(shift_info.instance, field_info, shift_info)
+    return shift_function_wrapper(field_info, shift_info, func)
 
 ## Validate
 ###########
@@ -1024,14 +1232,16 @@ def shift_any_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_in
         raise ShiftTypeMismatchError(f"expected a value, got `MISSING`")
     return True
 
-def shift_one_of_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> bool:
+@_shift_type_args(_empty_args_true)
+def shift_one_of_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> bool:
     """
     Attempts to validate field_info.val for each type in field_info.typ.args, returning True on the first successful validation.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
+    # Base type and Any args only need one isinstance check
+    types = _isinstance_types(args)
+    if types is not None and field_info.val is not Missing and isinstance(field_info.val, types):
         return True
 
     # One arg must match
@@ -1043,40 +1253,43 @@ def shift_one_of_type_validator(instance: Any, field_info: ShiftFieldInfo, shift
             pass
     raise ShiftTypeMismatchError(f"expected one of types `{args}`, got `{_get_type_name(field_info.val)}`")
 
-def shift_one_of_val_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> bool:
+@_shift_type_args(_empty_args_true)
+def shift_one_of_val_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> bool:
     """
     Returns if field_info.val is in field_info.typ.args.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return True
-
     # One val must match
     if not field_info.val in args:
         raise ShiftTypeMismatchError(f"expected one of values `{args}`, got `{field_info.val}`")
     return True
 
-def shift_all_of_single_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> bool:
+@_shift_type_args(_empty_args_true)
+def shift_all_of_single_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> bool:
     """
     Returns if, for all field_info.val, field_info.val[i] is the same type as field_info.typ.args[0].
     Raises ShiftTypeMismatchError if any field_info.val is a different type than field_info.typ.args[0].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return True
-
     # Must have one arg and val must be list-like
     if len(args) != 1:
         raise ShiftTypeMismatchError(f"expected one type arg, got `{args}`")
     if not isinstance(field_info.val, Iterable):
         raise ShiftTypeMismatchError(f"expected value to be list-like, got `{field_info.val}`")
 
+    # Base type and Any args only need isinstance checks, fall through to find the failing value
+    types = _isinstance_types(args)
+    if types is not None:
+        typ = types[0]
+        if all(val is not Missing and isinstance(val, typ) for val in field_info.val):
+            return True
+
     # All values must be of type args[0]
+    arg = args[0]
+    name = f"{field_info.name}.{_get_type_name(arg)}"
     for i, val in enumerate(field_info.val):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(args[0])}[i]", args[0], val)
+        tmp_field_info = ShiftFieldInfo(f"{name}[{i}]", arg, val)
         try:
             if not shift_type_validator(instance, tmp_field_info, shift_info):
                 raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
@@ -1084,22 +1297,24 @@ def shift_all_of_single_type_validator(instance: Any, field_info: ShiftFieldInfo
             raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}: {e}")
     return True
 
-def shift_all_of_many_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> bool:
+@_shift_type_args(_empty_args_true)
+def shift_all_of_many_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> bool:
     """
     Returns if, for all field_info.val, field_info.val[i] is the same type as field_info.typ.args[i].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[i].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return True
-
     # Val must be list-like, and must have same len as args
     if not isinstance(field_info.val, Iterable):
         raise ShiftTypeMismatchError(f"expected value to be list-like, got `{field_info.val}`")
     if len(field_info.val) != len(args): # noqa
         raise ShiftTypeMismatchError(f"expected {len(args)} values, got {len(field_info.val)}") # noqa
 
+    # Base type and Any args only need isinstance checks, fall through to find the failing value
+    types = _isinstance_types(args)
+    if types is not None and all(val is not Missing and isinstance(val, typ) for val, typ in zip(field_info.val, types)):
+        return True
+
     # All values must be of type args[i]
     for i, (val, arg) in enumerate(zip(field_info.val, args)):
         tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
@@ -1110,21 +1325,31 @@ def shift_all_of_many_type_validator(instance: Any, field_info: ShiftFieldInfo,
             raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
     return True
 
-def shift_all_of_pair_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> bool:
+@_shift_type_args(_empty_args_true)
+def shift_all_of_pair_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> bool:
     """
     Returns if, for all field_info.val, field_info.val[i].key is the same type as field_info.typ.args[0] and field_info.val[i].val is the same type as field_info.typ.args[1].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[0] or field_info.typ.args[1].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return True
-
     # Must be dict-like
     if not hasattr(field_info.val, "items"):
         raise ShiftTypeMismatchError(f"expected value to be dict-like, got `{field_info.val}`")
 
+    # Base type and Any args only need isinstance checks, fall through to find the failing pair
+    types = _isinstance_types(args[:2])
+    if types is not None:
+        key_typ = types[0]
+        if len(types) > 1:
+            val_typ = types[1]
+            if all(key is not Missing and val is not Missing and isinstance(key, key_typ) and isinstance(val, val_typ)
+                   for key, val in field_info.val.items()):
+                return True
+        elif all(key is not Missing and isinstance(key, key_typ) for key, _ in field_info.val.items()):
+            return True
+
     # All key-val pairs must match type
+    has_val_typ = len(args) > 1
     for i, (key, val) in enumerate(field_info.val.items()):
         try:
             tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(key)}", args[0], key)
@@ -1134,7 +1359,7 @@ def shift_all_of_pair_type_validator(instance: Any, field_info: ShiftFieldInfo,
             raise ShiftTypeMismatchError(f"expected key at index {i} to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(key)}`: {e}")
 
         try:
-            if len(args) > 1:
+            if has_val_typ:
                 tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(val)}", args[1], val)
                 if not shift_type_validator(instance, tmp_field_info, shift_info):
                     raise ShiftTypeMismatchError(f"expected val at index {i} to be of type `{_get_type_name(args[1])}`, but got `{_get_type_name(val)}`")
@@ -1143,16 +1368,13 @@ def shift_all_of_pair_type_validator(instance: Any, field_info: ShiftFieldInfo,
 
     return True
 
-def shift_callable_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> bool:
+@_shift_type_args(_empty_args_true)
+def shift_callable_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> bool:
     """
     Returns if field.val is callable and matches the expected signature.
     Raises ShiftTypeMismatchError if field.val is not callable or has an invalid signature.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return True
-
     # Value must be callable
     if not callable(field_info.val):
         raise ShiftTypeMismatchError(f"expected callable, got `{_get_type_name(field_info.val)}`")
@@ -1198,8 +1420,10 @@ def shift_forward_ref_type_validator(instance: Any, field_info: ShiftFieldInfo,
     """
 
     # Check cache first
-    if field_info.typ in _resolved_forward_refs:
-        field_info.typ = _resolved_forward_refs[field_info.typ]
+    resolved = _resolved_forward_refs.get(field_info.typ)
+    if resolved is not None:
+        field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_validator(instance, field_info, shift_info)
 
     # Attempt to resolve the forward ref
@@ -1207,6 +1431,7 @@ def shift_forward_ref_type_validator(instance: Any, field_info: ShiftFieldInfo,
         resolved = resolve_forward_ref(field_info.typ, shift_info)
         register_forward_ref(field_info.typ, resolved)
         field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_validator(instance, field_info, shift_info)
     except Exception as e:
         raise ShiftTypeMismatchError(f"could not resolve forward reference `{field_info.typ}`: {e}")
@@ -1217,11 +1442,8 @@ def shift_shift_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_
     Raises ShiftTypeMismatchError if the field.val is not a ShiftModel subclass, or class construction fails.
     """
 
-    try:
-        if isinstance(field_info.val, ShiftModel) or issubclass(field_info.val, ShiftModel):
-            return True
-    except Exception:
-        pass
+    if _is_shift_model(field_info.val):
+        return True
     if isinstance(field_info.val, dict):
         return True
     raise ShiftTypeMismatchError(f"expected ShiftModel subclass or dict, got `{_get_type_name(field_info.val)}`")
@@ -1254,10 +1476,15 @@ def shift_type_validator(instance: Any, field_info: ShiftFieldInfo, shift_info:
     Raises UnknownShiftTypeError if the field type is not registered in the ShiftTypes registry.
     """
 
-    shift_typ = get_shift_type(field_info.typ)
+    shift_typ = field_info.shift_type
+    if shift_typ is None:
+        shift_typ = get_shift_type(field_info.typ)
     if shift_typ is None:
         raise UnknownShiftTypeError(f"has unknown type `{field_info.typ}`")
-    return shift_function_wrapper(field_info, shift_info, shift_typ.validator)
+    func = shift_typ.validator
+    if _shift_functions.get(func) is True:
+        return func(shift_info.instance, field_info, shift_info)
+    return shift_function_wrapper(field_info, shift_info, func)
 
 ## Set
 ######
@@ -1302,16 +1529,13 @@ def shift_any_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info:
         raise ShiftTypeMismatchError(f"expected a value, got `MISSING`")
     return field_info.val
 
-def shift_one_of_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_one_of_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to set field_info.val for each type in field_info.typ.args, returning the first successful set value.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # One arg must match
     for arg in args:
         try:
@@ -1322,31 +1546,25 @@ def shift_one_of_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_in
             pass
     raise ShiftTypeMismatchError(f"expected one of types `{args}`, got `{_get_type_name(field_info.val)}`")
 
-def shift_one_of_val_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_one_of_val_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Returns field_info.val if val is in field_info.typ.args.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # One val must match
     if not field_info.val in args:
         raise ShiftTypeMismatchError(f"expected one of values `{args}`, got `{field_info.val}`")
     return field_info.val
 
-def shift_all_of_single_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_single_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to, for all field_info.val, set field_info.val[i] as the type field_info.typ.args[0].
     Raises ShiftTypeMismatchError if any field_info.val is a different type than field_info.typ.args[0].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Must have one arg and val must be list-like
     if len(args) != 1:
         raise ShiftTypeMismatchError(f"expected one type arg, got `{args}`")
@@ -1358,29 +1576,30 @@ def shift_all_of_single_type_setter(instance: Any, field_info: ShiftFieldInfo, s
     if not indexable:
         field_info.val = list(field_info.val)
 
-    # All values must be of type args[0]
-    for i, val in enumerate(field_info.val):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(args[0])}[{i}]", args[0], val)
-        try:
-            field_info.val[i] = shift_type_setter(instance, tmp_field_info, shift_info)
-        except ShiftTypeMismatchError:
-            raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
+    # All values must be of type args[0], vals that set as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'setter')
+    if types is None or not all(val is not Missing and isinstance(val, types) for val in field_info.val):
+        arg = args[0]
+        name = f"{field_info.name}.{_get_type_name(arg)}"
+        for i, val in enumerate(field_info.val):
+            tmp_field_info = ShiftFieldInfo(f"{name}[{i}]", arg, val)
+            try:
+                field_info.val[i] = shift_type_setter(instance, tmp_field_info, shift_info)
+            except ShiftTypeMismatchError:
+                raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
 
     # Convert back typ if needed
     if not indexable:
-        field_info.val = get_origin(field_info.typ)(field_info.val)
+        field_info.val = _get_origin(field_info.typ)(field_info.val)
     return field_info.val
 
-def shift_all_of_many_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_many_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to, for all field_info.val, set field_info.val[i] as the type field_info.typ.args[i].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[i].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Val must be list-like, and must have same len as args
     if not isinstance(field_info.val, Iterable):
         raise ShiftTypeMismatchError(f"expected value to be list-like, got `{field_info.val}`")
@@ -1392,35 +1611,43 @@ def shift_all_of_many_type_setter(instance: Any, field_info: ShiftFieldInfo, shi
     if not indexable:
         field_info.val = list(field_info.val)
 
-    # All values must be of type args[i]
-    for i, (val, arg) in enumerate(zip(field_info.val, args)):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
-        try:
-            field_info.val[i] = shift_type_setter(instance, tmp_field_info, shift_info)
-        except ShiftTypeMismatchError as e:
-            raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
+    # All values must be of type args[i], vals that set as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'setter')
+    if types is None or not all(val is not Missing and isinstance(val, typ) for val, typ in zip(field_info.val, types)):
+        for i, (val, arg) in enumerate(zip(field_info.val, args)):
+            tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
+            try:
+                field_info.val[i] = shift_type_setter(instance, tmp_field_info, shift_info)
+            except ShiftTypeMismatchError as e:
+                raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
 
     # Convert back typ if needed
     if not indexable:
-        field_info.val = get_origin(field_info.typ)(field_info.val)
+        field_info.val = _get_origin(field_info.typ)(field_info.val)
     return field_info.val
 
-def shift_all_of_pair_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_pair_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to, for all field_info.val, set field_info.val[i].key as field_info.typ.args[0] and set field_info.val[i].val as field_info.typ.args[1].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[0] or field_info.typ.args[1].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Must be dict-like
     if not hasattr(field_info.val, "items"):
         raise ShiftTypeMismatchError(f"expected value to be dict-like, got `{field_info.val}`")
 
+    # Key-val pairs that set as themselves can be copied directly
+    key_types = _as_is_types(args[:1], 'setter')
+    val_types = _as_is_types(args[1:2], 'setter') if len(args) > 1 else (object,)
+    if key_types is not None and val_types is not None and all(
+            key is not Missing and val is not Missing and isinstance(key, key_types) and isinstance(val, val_types)
+            for key, val in field_info.val.items()):
+        return dict(field_info.val.items())
+
     # All key-val pairs must match type
     new_val = {}
+    has_val_typ = len(args) > 1
     for i, (key, val) in enumerate(field_info.val.items()):
         try:
             tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(key)}", args[0], key)
@@ -1429,7 +1656,7 @@ def shift_all_of_pair_type_setter(instance: Any, field_info: ShiftFieldInfo, shi
             raise ShiftTypeMismatchError(f"expected key at index {i} to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(key)}`: {e}")
 
         try:
-            if len(args) > 1:
+            if has_val_typ:
                 tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(val)}", args[1], val)
                 new_val[key] = shift_type_setter(instance, tmp_field_info, shift_info)
             else:
@@ -1439,16 +1666,13 @@ def shift_all_of_pair_type_setter(instance: Any, field_info: ShiftFieldInfo, shi
 
     return new_val
 
-def shift_callable_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any:
+@_shift_type_args(_empty_args_val)
+def shift_callable_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any:
     """
     Attempts to check if value is callable and has a readable signature.
     Raises ShiftTypeMismatchError if value is not callable or has an unreadable signature.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Value must be callable
     if not callable(field_info.val):
         raise ShiftTypeMismatchError(f"expected callable, got `{_get_type_name(field_info.val)}`")
@@ -1468,8 +1692,10 @@ def shift_forward_ref_type_setter(instance: Any, field_info: ShiftFieldInfo, shi
     """
 
     # Check cache first
-    if field_info.typ in _resolved_forward_refs:
-        field_info.typ = _resolved_forward_refs[field_info.typ]
+    resolved = _resolved_forward_refs.get(field_info.typ)
+    if resolved is not None:
+        field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_setter(instance, field_info, shift_info)
 
     # Attempt to resolve the forward ref
@@ -1477,6 +1703,7 @@ def shift_forward_ref_type_setter(instance: Any, field_info: ShiftFieldInfo, shi
         resolved = resolve_forward_ref(field_info.typ, shift_info)
         register_forward_ref(field_info.typ, resolved)
         field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_setter(instance, field_info, shift_info)
     except Exception as e:
         raise ShiftTypeMismatchError(f"could not resolve forward reference `{field_info.typ}`: {e}")
@@ -1487,11 +1714,8 @@ def shift_shift_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_inf
     Raises ShiftTypeMismatchError if the field.val is not a ShiftModel subclass, or class construction fails.
     """
 
-    try:
-        if isinstance(field_info.val, ShiftModel) or issubclass(field_info.val, ShiftModel):
-            return field_info.val
-    except Exception:
-        pass
+    if _is_shift_model(field_info.val):
+        return field_info.val
     if isinstance(field_info.val, dict) and isinstance(field_info.typ, type):
         return field_info.typ(**field_info.val)
     raise ShiftTypeMismatchError(f"expected ShiftModel subclass or dict, got `{_get_type_name(field_info.val)}`")
@@ -1524,10 +1748,15 @@ def shift_type_setter(instance: Any, field_info: ShiftFieldInfo, shift_info: Shi
     Raises UnknownShiftTypeError if the field type is not registered in the ShiftTypes registry.
     """
 
-    shift_typ = get_shift_type(field_info.typ)
+    shift_typ = field_info.shift_type
+    if shift_typ is None:
+        shift_typ = get_shift_type(field_info.typ)
     if shift_typ is None:
         raise UnknownShiftTypeError(f"has unknown type `{field_info.typ}`")
-    return shift_function_wrapper(field_info, shift_info, shift_typ.setter)
+    func = shift_typ.setter
+    if _shift_functions.get(func) is True:
+        return func(shift_info.instance, field_info, shift_info)
+    return shift_function_wrapper(field_info, shift_info, func)
 
 ## ShiftRepr
 ############
@@ -1572,16 +1801,13 @@ def shift_any_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: S
         raise ShiftTypeMismatchError(f"expected a value, got `MISSING`")
     return repr(field_info.val)
 
-def shift_one_of_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> str | None:
+@_shift_type_args(_empty_args_repr)
+def shift_one_of_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> str | None:
     """
     Attempts to repr field_info.val for each type in field_info.typ.args, returning the first successful repred value.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return repr(field_info.val)
-
     # One arg must match
     for arg in args:
         try:
@@ -1591,31 +1817,25 @@ def shift_one_of_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info
             pass
     raise ShiftTypeMismatchError(f"expected one of types `{args}`, got `{_get_type_name(field_info.val)}`")
 
-def shift_one_of_val_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> str | None:
+@_shift_type_args(_empty_args_repr)
+def shift_one_of_val_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> str | None:
     """
     Returns repr(field_info.val) if val is in field_info.typ.args.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return repr(field_info.val)
-
     # One val must match
     if not field_info.val in args:
         raise ShiftTypeMismatchError(f"expected one of values `{args}`, got `{field_info.val}`")
     return repr(field_info.val)
 
-def shift_all_of_single_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> str | None:
+@_shift_type_args(_empty_args_repr)
+def shift_all_of_single_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> str | None:
     """
     Attempts to, for all field_info.val, repr field_info.val[i] as the type field_info.typ.args[0].
     Raises ShiftTypeMismatchError if any field_info.val is a different type than field_info.typ.args[0].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return repr(field_info.val)
-
     # Must have one arg and val must be list-like
     if len(args) != 1:
         raise ShiftTypeMismatchError(f"expected one type arg, got `{args}`")
@@ -1630,33 +1850,36 @@ def shift_all_of_single_type_repr(instance: Any, field_info: ShiftFieldInfo, shi
     if not indexable:
         tmp = list(field_info.val)
 
-    # All values must be of type args[0]
-    reprs = []
-    for i, val in enumerate(tmp):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(args[0])}[{i}]", args[0], val)
-        try:
-            reprs.append(shift_type_repr(instance, tmp_field_info, shift_info))
-        except ShiftTypeMismatchError:
-            raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
+    # All values must be of type args[0], vals that repr as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'repr')
+    if types is not None and all(val is not Missing and isinstance(val, types) for val in tmp):
+        reprs = [repr(val) for val in tmp]
+    else:
+        reprs = []
+        arg = args[0]
+        name = f"{field_info.name}.{_get_type_name(arg)}"
+        for i, val in enumerate(tmp):
+            tmp_field_info = ShiftFieldInfo(f"{name}[{i}]", arg, val)
+            try:
+                reprs.append(shift_type_repr(instance, tmp_field_info, shift_info))
+            except ShiftTypeMismatchError:
+                raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
 
     # Return str based on type
-    origin = get_origin(field_info.typ)
+    origin = _get_origin(field_info.typ)
     if origin is set:
         return '{' + ', '.join(reprs) + '}'
     elif origin is frozenset:
         return f'frozenset({", ".join(reprs)})'
     return '[' + ', '.join(reprs) + ']'
 
-def shift_all_of_many_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> str | None:
+@_shift_type_args(_empty_args_repr)
+def shift_all_of_many_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> str | None:
     """
     Attempts to, for all field_info.val, repr field_info.val[i] as the type field_info.typ.args[i].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[i].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return repr(field_info.val)
-
     # Val must be list-like, and must have same len as args
     if not isinstance(field_info.val, Iterable):
         raise ShiftTypeMismatchError(f"expected value to be list-like, got `{field_info.val}`")
@@ -1671,32 +1894,43 @@ def shift_all_of_many_type_repr(instance: Any, field_info: ShiftFieldInfo, shift
     if not indexable:
         tmp = list(field_info.val)
 
-    # All values must be of type args[i]
-    reprs = []
-    for i, (val, arg) in enumerate(zip(tmp, args)):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
-        try:
-            reprs.append(shift_type_repr(instance, tmp_field_info, shift_info))
-        except ShiftTypeMismatchError as e:
-            raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
+    # All values must be of type args[i], vals that repr as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'repr')
+    if types is not None and all(val is not Missing and isinstance(val, typ) for val, typ in zip(tmp, types)):
+        reprs = [repr(val) for val in tmp]
+    else:
+        reprs = []
+        for i, (val, arg) in enumerate(zip(tmp, args)):
+            tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
+            try:
+                reprs.append(shift_type_repr(instance, tmp_field_info, shift_info))
+            except ShiftTypeMismatchError as e:
+                raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
 
     # Return str, assuming typ is tuple
     return '(' + ', '.join(reprs) + ')'
 
-def shift_all_of_pair_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> str | None:
+@_shift_type_args(_empty_args_repr)
+def shift_all_of_pair_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> str | None:
     """
     Attempts to, for all field_info.val, repr field_info.val[i].key as field_info.typ.args[0] and repr field_info.val[i].val as field_info.typ.args[1].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[0] or field_info.typ.args[1].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return repr(field_info.val)
-
     # Must be dict-like
     if not hasattr(field_info.val, "items"):
         raise ShiftTypeMismatchError(f"expected value to be dict-like, got `{field_info.val}`")
 
+    # Key-val pairs that repr as themselves don't need a per-pair dispatch
+    has_val_typ = len(args) > 1
+    key_types = _as_is_types(args[:1], 'repr')
+    val_types = _as_is_types(args[1:2], 'repr') if has_val_typ else (object,)
+    if key_types is not None and val_types is not None and all(
+            key is not Missing and val is not Missing and isinstance(key, key_types) and isinstance(val, val_types)
+            for key, val in field_info.val.items()):
+        new_val = {repr(key): repr(val) if has_val_typ else val for key, val in field_info.val.items()}
+        return '{' + ', '.join(f"{key}: {val}" for key, val in new_val.items()) + '}'
+
     # All key-val pairs must match type
     new_val = {}
     for i, (key, val) in enumerate(field_info.val.items()):
@@ -1707,7 +1941,7 @@ def shift_all_of_pair_type_repr(instance: Any, field_info: ShiftFieldInfo, shift
             raise ShiftTypeMismatchError(f"expected key at index {i} to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(key)}`: {e}")
 
         try:
-            if len(args) > 1:
+            if has_val_typ:
                 tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(val)}", args[1], val)
                 new_val[key] = shift_type_repr(instance, tmp_field_info, shift_info)
             else:
@@ -1721,16 +1955,13 @@ def shift_all_of_pair_type_repr(instance: Any, field_info: ShiftFieldInfo, shift
         r += f"{key}: {val}, "
     return '{' + r[:-2] + '}'
 
-def shift_callable_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> str | None:
+@_shift_type_args(_empty_args_repr)
+def shift_callable_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> str | None:
     """
     Attempts to check if value is callable and has a readable signature.
     Raises ShiftTypeMismatchError if value is not callable or has an unreadable signature.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return repr(field_info.val)
-
     # Value must be callable
     if not callable(field_info.val):
         raise ShiftTypeMismatchError(f"expected callable, got `{_get_type_name(field_info.val)}`")
@@ -1750,8 +1981,10 @@ def shift_forward_ref_type_repr(instance: Any, field_info: ShiftFieldInfo, shift
     """
 
     # Check cache first
-    if field_info.typ in _resolved_forward_refs:
-        field_info.typ = _resolved_forward_refs[field_info.typ]
+    resolved = _resolved_forward_refs.get(field_info.typ)
+    if resolved is not None:
+        field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_repr(instance, field_info, shift_info)
 
     # Attempt to resolve the forward ref
@@ -1759,6 +1992,7 @@ def shift_forward_ref_type_repr(instance: Any, field_info: ShiftFieldInfo, shift
         resolved = resolve_forward_ref(field_info.typ, shift_info)
         register_forward_ref(field_info.typ, resolved)
         field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_repr(instance, field_info, shift_info)
     except Exception as e:
         raise ShiftTypeMismatchError(f"could not resolve forward reference `{field_info.typ}`: {e}")
@@ -1800,10 +2034,15 @@ def shift_type_repr(instance: Any, field_info: ShiftFieldInfo, shift_info: Shift
     Raises UnknownShiftTypeError if the field type is not registered in the ShiftTypes registry.
     """
 
-    shift_typ = get_shift_type(field_info.typ)
+    shift_typ = field_info.shift_type
+    if shift_typ is None:
+        shift_typ = get_shift_type(field_info.typ)
     if shift_typ is None:
         raise UnknownShiftTypeError(f"has unknown type `{field_info.typ}`")
-    return shift_function_wrapper(field_info, shift_info, shift_typ.repr)
+    func = shift_typ.repr
+    if _shift_functions.get(func) is True:
+        return func(shift_info.instance, field_info, shift_info)
+    return shift_function_wrapper(field_info, shift_info, func)
 
 ## Serialize
 ############
@@ -1848,16 +2087,13 @@ def shift_any_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_i
         raise ShiftTypeMismatchError(f"expected a value, got `MISSING`")
     return field_info.val
 
-def shift_one_of_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any | Missing:
+@_shift_type_args(_empty_args_val)
+def shift_one_of_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any | Missing:
     """
     Attempts to serialize field_info.val for each type in field_info.typ.args, returning the first successful serialized value.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # One arg must match
     for arg in args:
         try:
@@ -1867,31 +2103,25 @@ def shift_one_of_type_serializer(instance: Any, field_info: ShiftFieldInfo, shif
             pass
     raise ShiftTypeMismatchError(f"expected one of types `{args}`, got `{_get_type_name(field_info.val)}`")
 
-def shift_one_of_val_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any | Missing:
+@_shift_type_args(_empty_args_val)
+def shift_one_of_val_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any | Missing:
     """
     Returns field_info.val if val is in field_info.typ.args.
     Raises ShiftTypeMismatchError if no type in field_info.typ.args matches field_info.val.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # One val must match
     if not field_info.val in args:
         raise ShiftTypeMismatchError(f"expected one of values `{args}`, got `{field_info.val}`")
     return field_info.val
 
-def shift_all_of_single_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any | Missing:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_single_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any | Missing:
     """
     Attempts to, for all field_info.val, serialize field_info.val[i] as the type field_info.typ.args[0].
     Raises ShiftTypeMismatchError if any field_info.val is a different type than field_info.typ.args[0].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Must have one arg and val must be list-like
     if len(args) != 1:
         raise ShiftTypeMismatchError(f"expected one type arg, got `{args}`")
@@ -1906,32 +2136,33 @@ def shift_all_of_single_type_serializer(instance: Any, field_info: ShiftFieldInf
     if not indexable:
         tmp = list(field_info.val)
 
-    # All values must be of type args[0]
-    for i, val in enumerate(tmp):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(args[0])}[i]", args[0], val)
-        try:
-            tmp[i] = shift_type_serializer(instance, tmp_field_info, shift_info)
-        except ShiftTypeMismatchError:
-            raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
+    # All values must be of type args[0], vals that serialize as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'serializer')
+    if types is None or not all(val is not Missing and isinstance(val, types) for val in tmp):
+        arg = args[0]
+        name = f"{field_info.name}.{_get_type_name(arg)}"
+        for i, val in enumerate(tmp):
+            tmp_field_info = ShiftFieldInfo(f"{name}[{i}]", arg, val)
+            try:
+                tmp[i] = shift_type_serializer(instance, tmp_field_info, shift_info)
+            except ShiftTypeMismatchError:
+                raise ShiftTypeMismatchError(f"expected all values to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(val)}` at index {i}")
 
     # Build return value based on type
-    origin = get_origin(field_info.typ)
+    origin = _get_origin(field_info.typ)
     if origin is set:
         return set(tmp)
     elif origin is frozenset:
         return frozenset(tmp)
     return tmp
 
-def shift_all_of_many_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any | Missing:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_many_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any | Missing:
     """
     Attempts to, for all field_info.val, serialize field_info.val[i] as the type field_info.typ.args[i].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[i].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Val must be list-like, and must have same len as args
     if not isinstance(field_info.val, Iterable):
         raise ShiftTypeMismatchError(f"expected value to be list-like, got `{field_info.val}`")
@@ -1946,33 +2177,41 @@ def shift_all_of_many_type_serializer(instance: Any, field_info: ShiftFieldInfo,
     if not indexable:
         tmp = list(field_info.val)
 
-    # All values must be of type args[i]
-    for i, (val, arg) in enumerate(zip(tmp, args)):
-        tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
-        try:
-            tmp[i] = shift_type_serializer(instance, tmp_field_info, shift_info)
-        except ShiftTypeMismatchError as e:
-            raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
+    # All values must be of type args[i], vals that serialize as themselves don't need a per-value dispatch
+    types = _as_is_types(args, 'serializer')
+    if types is None or not all(val is not Missing and isinstance(val, typ) for val, typ in zip(tmp, types)):
+        for i, (val, arg) in enumerate(zip(tmp, args)):
+            tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(arg)}", arg, val)
+            try:
+                tmp[i] = shift_type_serializer(instance, tmp_field_info, shift_info)
+            except ShiftTypeMismatchError as e:
+                raise ShiftTypeMismatchError(f"expected value at index {i} to be of type `{_get_type_name(arg)}`, but got `{_get_type_name(val)}`: {e}")
 
     # Build return value, assuming typ is tuple
     return tuple(tmp)
 
-def shift_all_of_pair_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any | Missing:
+@_shift_type_args(_empty_args_val)
+def shift_all_of_pair_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any | Missing:
     """
     Attempts to, for all field_info.val, serialize field_info.val[i].key as field_info.typ.args[0] and serialize field_info.val[i].val as field_info.typ.args[1].
     Raises ShiftTypeMismatchError if any field_info.val[i] is a different type than field_info.typ.args[0] or field_info.typ.args[1].
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Must be dict-like
     if not hasattr(field_info.val, "items"):
         raise ShiftTypeMismatchError(f"expected value to be dict-like, got `{field_info.val}`")
 
+    # Key-val pairs that serialize as themselves can be copied directly
+    key_types = _as_is_types(args[:1], 'serializer')
+    val_types = _as_is_types(args[1:2], 'serializer') if len(args) > 1 else (object,)
+    if key_types is not None and val_types is not None and all(
+            key is not Missing and val is not Missing and isinstance(key, key_types) and isinstance(val, val_types)
+            for key, val in field_info.val.items()):
+        return dict(field_info.val.items())
+
     # All key-val pairs must match type
     new_val = {}
+    has_val_typ = len(args) > 1
     for i, (key, val) in enumerate(field_info.val.items()):
         try:
             tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(key)}", args[0], key)
@@ -1981,7 +2220,7 @@ def shift_all_of_pair_type_serializer(instance: Any, field_info: ShiftFieldInfo,
             raise ShiftTypeMismatchError(f"expected key at index {i} to be of type `{_get_type_name(args[0])}`, but got `{_get_type_name(key)}`: {e}")
 
         try:
-            if len(args) > 1:
+            if has_val_typ:
                 tmp_field_info = ShiftFieldInfo(f"{field_info.name}.{_get_type_name(val)}", args[1], val)
                 new_val[key] = shift_type_serializer(instance, tmp_field_info, shift_info)
             else:
@@ -1991,16 +2230,13 @@ def shift_all_of_pair_type_serializer(instance: Any, field_info: ShiftFieldInfo,
 
     return new_val
 
-def shift_callable_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo) -> Any | Missing:
+@_shift_type_args(_empty_args_val)
+def shift_callable_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info: ShiftInfo, args: tuple) -> Any | Missing:
     """
     Attempts to check if value is callable and has a readable signature.
     Raises ShiftTypeMismatchError if value is not callable or has an unreadable signature.
     """
 
-    args = get_args(field_info.typ)
-    if not args:
-        return field_info.val
-
     # Value must be callable
     if not callable(field_info.val):
         raise ShiftTypeMismatchError(f"expected callable, got `{_get_type_name(field_info.val)}`")
@@ -2020,8 +2256,10 @@ def shift_forward_ref_type_serializer(instance: Any, field_info: ShiftFieldInfo,
     """
 
     # Check cache first
-    if field_info.typ in _resolved_forward_refs:
-        field_info.typ = _resolved_forward_refs[field_info.typ]
+    resolved = _resolved_forward_refs.get(field_info.typ)
+    if resolved is not None:
+        field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_repr(instance, field_info, shift_info)
 
     # Attempt to resolve the forward ref
@@ -2029,6 +2267,7 @@ def shift_forward_ref_type_serializer(instance: Any, field_info: ShiftFieldInfo,
         resolved = resolve_forward_ref(field_info.typ, shift_info)
         register_forward_ref(field_info.typ, resolved)
         field_info.typ = resolved
+        field_info.shift_type = None
         return shift_type_serializer(instance, field_info, shift_info)
     except Exception as e:
         raise ShiftTypeMismatchError(f"could not resolve forward reference `{field_info.typ}`: {e}")
@@ -2070,10 +2309,15 @@ def shift_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info:
     Raises UnknownShiftTypeError if the field type is not registered in the ShiftTypes registry.
     """
 
-    shift_typ = get_shift_type(field_info.typ)
+    shift_typ = field_info.shift_type
+    if shift_typ is None:
+        shift_typ = get_shift_type(field_info.typ)
     if shift_typ is None:
         raise UnknownShiftTypeError(f"has unknown type `{field_info.typ}`")
-    return shift_function_wrapper(field_info, shift_info, shift_typ.serializer)
+    func = shift_typ.serializer
+    if _shift_functions.get(func) is True:
+        return func(shift_info.instance, field_info, shift_info)
+    return shift_function_wrapper(field_info, shift_info, func)
 
 
 
@@ -2085,11 +2329,80 @@ def shift_type_serializer(instance: Any, field_info: ShiftFieldInfo, shift_info:
 ## Misc
 ############
 
+_decorator_keys = ("pre_transformer_skips", "pre_transformers", "transformers", "pre_validator_skips",
+                   "pre_validators", "validators", "setters", "reprs", "serializers")
+
+def _build_field_handlers(decorators: dict[str, list[AnyShiftDecorator] | list[str]]) -> dict[str, ShiftFieldHandlers]:
+    """Builds a dict of field names to ShiftFieldHandlers for every field with a decorator function"""
+    handlers: dict[str, ShiftFieldHandlers] = {}
+    for key, attr in (("pre_transformers", "pre_transformer"), ("transformers", "transformer"),
+                      ("pre_validators", "pre_validator"), ("validators", "validator"),
+                      ("setters", "setter"), ("reprs", "repr"), ("serializers", "serializer")):
+        for field_name, func in decorators[key].items():
+            handler = handlers.get(field_name)
+            if handler is None:
+                handler = handlers[field_name] = ShiftFieldHandlers()
+            setattr(handler, attr, func)
+    for field_name in decorators["pre_transformer_skips"]:
+        if field_name in handlers:
+            handlers[field_name].pre_transformer_skip = True
+    for field_name in decorators["pre_validator_skips"]:
+        if field_name in handlers:
+            handlers[field_name].pre_validator_skip = True
+    return handlers
+
+def _is_simple_output(fields: list[ShiftFieldInfo], handlers: dict[str, ShiftFieldHandlers]) -> bool:
+    """Returns whether repr/serialize can skip per-field dispatch for fields and handlers"""
+    return (not any(handler.repr is not None or handler.serializer is not None for handler in handlers.values())
+            and all(field.shift_type is base_shift_type and not isinstance(field.default, ShiftField) for field in fields))
+
+def _handlers_source(info: ShiftInfo) -> tuple:
+    return (info.pre_transformer_skips, info.pre_transformers, info.transformers, info.pre_validator_skips,
+            info.pre_validators, info.validators, info.setters, info.reprs, info.serializers)
+
+def _sync_shift_info(info: ShiftInfo) -> dict[str, ShiftFieldHandlers]:
+    """Rebuilds the cached parts of info that are stale after its attributes were changed, e.g. in __pre_init__, and returns info.handlers"""
+    stale_output = info.fields is not info.fields_source
+    source = _handlers_source(info)
+    # handlers_source holds copies, so this compares contents and catches in-place edits too
+    if info.handlers_source != source:
+        info.handlers = _build_field_handlers(dict(zip(_decorator_keys, source)))
+        info.handlers_source = tuple(val.copy() for val in source)
+        stale_output = True
+    if stale_output:
+        info.fields_source = info.fields
+        info.simple_output = _is_simple_output(info.fields, info.handlers)
+    return info.handlers
+
+def _build_config_output(shift_config: ShiftConfig) -> tuple[str | None, dict[str, Any] | None]:
+    """Returns the repr and serialized shift_config if it is part of repr/serialize output, else None for both"""
+    if shift_config.include_private_fields_in_serialization and (shift_config != DEFAULT_SHIFT_CONFIG or shift_config.include_default_fields_in_serialization):
+        return repr(shift_config), serialize(shift_config)
+    return None, None
+
+def _sync_config_output(info: ShiftInfo) -> None:
+    """Rebuilds config_repr and config_serialized if shift_config was replaced or edited, e.g. in __pre_init__"""
+    # config_source is a copy, so this compares contents and catches in-place edits too
+    if info.config_source != info.shift_config:
+        info.config_repr, info.config_serialized = _build_config_output(info.shift_config)
+        info.config_source = copy.copy(info.shift_config)
+
+def _freeze(val: Any) -> Any:
+    """Returns a hashable version of val, converting lists to tuples, and dicts and sets to frozensets"""
+    # Dicts compare equal regardless of insertion order, so their frozen form must too
+    if isinstance(val, dict):
+        return frozenset((key, _freeze(v)) for key, v in val.items())
+    if isinstance(val, (list, tuple)):
+        return tuple(_freeze(v) for v in val)
+    if isinstance(val, (set, frozenset)):
+        return frozenset(_freeze(v) for v in val)
+    return val
+
 def _build_field_error(field_name: str, error: Exception) -> ShiftFieldError | Exception:
     # Don't wrap if it's already a ShiftFieldError
     if isinstance(error, ShiftFieldError):
         return error
-    if isinstance(error, ShiftTypeMismatchError) or isinstance(error, UnknownShiftTypeError):
+    if isinstance(error, (ShiftTypeMismatchError, UnknownShiftTypeError)):
         return ShiftFieldError(field_name, error.msg)
     return error
 
@@ -2099,11 +2412,13 @@ def _build_field_error(field_name: str, error: Exception) -> ShiftFieldError | E
 ############
 
 def _transform_field(field: ShiftFieldInfo, info: ShiftInfo) -> None:
+    handler = info.handlers.get(field.name)
+
     # Call pre-transformer if present
-    if field.name in info.pre_transformers:
-        field.val = shift_function_wrapper(field, info, info.pre_transformers[field.name])
-    if field.name in info.pre_transformers and field.name in info.pre_transformer_skips:
-        return
+    if handler is not None and handler.pre_transformer is not None:
+        field.val = shift_function_wrapper(field, info, handler.pre_transformer)
+        if handler.pre_transformer_skip:
+            return
 
     # Run type transformation
     if field.val is Missing:
@@ -2113,19 +2428,37 @@ def _transform_field(field: ShiftFieldInfo, info: ShiftInfo) -> None:
     field.val = shift_type_transformer(field.val, field, info)
 
     # Call field transformer if present
-    if field.name in info.transformers:
-        field.val = shift_function_wrapper(field, info, info.transformers[field.name])
+    if handler is not None and handler.transformer is not None:
+        field.val = shift_function_wrapper(field, info, handler.transformer)
 
 def _transform(info: ShiftInfo) -> None:
+    fail_fast = info.shift_config.fail_fast
+    errors = info.transform_errors
+    handlers = _sync_shift_info(info)
+
     # Transform all class fields
     for field in info.fields:
+        # Undecorated base type fields only need the default set and an isinstance check
+        shift_typ = field.shift_type
+        if shift_typ is not None and shift_typ.transformer is shift_base_type_transformer and field.name not in handlers:
+            if field.val is Missing and not isinstance(field.default, ShiftField):
+                field.val = field.default
+            if isinstance(field.val, field.typ):
+                continue
+        # Undecorated Any fields only need the default set and a Missing check
+        elif shift_typ is not None and shift_typ.transformer is shift_any_type_transformer and field.name not in handlers:
+            if field.val is Missing and not isinstance(field.default, ShiftField):
+                field.val = field.default
+            if field.val is not Missing:
+                continue
+
         try:
             _transform_field(field, info)
         except ShiftError as e:
             e = _build_field_error(field.name, e)
-            if info.shift_config.fail_fast:
+            if fail_fast:
                 raise e
-            info.transform_errors.append(e)
+            errors.append(e)
 
 
 
@@ -2133,33 +2466,52 @@ def _transform(info: ShiftInfo) -> None:
 ###########
 
 def _validate_field(field: ShiftFieldInfo, info: ShiftInfo) -> bool:
+    handler = info.handlers.get(field.name)
+
     # Call pre-validator if present
-    if field.name in info.pre_validators and not shift_function_wrapper(field, info, info.pre_validators[field.name]):
-        return False
-    if field.name in info.pre_validators and field.name in info.pre_validator_skips:
-        return True
+    if handler is not None and handler.pre_validator is not None:
+        if not shift_function_wrapper(field, info, handler.pre_validator):
+            return False
+        if handler.pre_validator_skip:
+            return True
 
-    # Run type validation
-    if not shift_type_validator(field.val, field, info):
-        return False
+    # Run type validation - base types are a single isinstance check, so skip the dispatch when it passes
+    shift_typ = field.shift_type
+    if shift_typ is None or shift_typ.validator is not shift_base_type_validator or not isinstance(field.val, field.typ):
+        if not shift_type_validator(field.val, field, info):
+            return False
 
     # Call field validator if present
-    if field.name in info.validators and not shift_function_wrapper(field, info, info.validators[field.name]):
+    if handler is not None and handler.validator is not None and not shift_function_wrapper(field, info, handler.validator):
         return False
 
     return True
 
 def _validate(info: ShiftInfo) -> bool:
+    fail_fast = info.shift_config.fail_fast
+    errors = info.validation_errors
+    handlers = _sync_shift_info(info)
+
     all_valid = True
     for field in info.fields:
+        # Undecorated base type fields only need an isinstance check
+        shift_typ = field.shift_type
+        if (shift_typ is not None and shift_typ.validator is shift_base_type_validator and field.name not in handlers
+                and isinstance(field.val, field.typ)):
+            continue
+        # Undecorated Any fields only need a Missing check
+        if (shift_typ is not None and shift_typ.validator is shift_any_type_validator and field.name not in handlers
+                and field.val is not Missing):
+            continue
+
         try:
             if not _validate_field(field, info):
                 raise ShiftFieldError(field.name, 'failed validation')
         except ShiftError as e:
             e = _build_field_error(field.name, e)
-            if info.shift_config.fail_fast:
+            if fail_fast:
                 raise e
-            info.validation_errors.append(e)
+            errors.append(e)
             all_valid = False
 
     return all_valid
@@ -2171,39 +2523,58 @@ def _validate(info: ShiftInfo) -> bool:
 
 def _set_field(field: ShiftFieldInfo, info: ShiftInfo) -> None:
     # If field setter, call (assume set in function)
-    if field.name in info.setters:
-        field.val = shift_function_wrapper(field, info, info.setters[field.name])
+    handler = info.handlers.get(field.name)
+    if handler is not None and handler.setter is not None:
+        field.val = shift_function_wrapper(field, info, handler.setter)
         return
 
     # Run type set
     setattr(info.instance, field.name, shift_type_setter(field.val, field, info))
 
 def _set(info: ShiftInfo) -> None:
+    fail_fast = info.shift_config.fail_fast
+    errors = info.set_errors
+    handlers = _sync_shift_info(info)
+    instance = info.instance
+
     for field in info.fields:
+        # Undecorated base type fields are set directly
+        shift_typ = field.shift_type
+        if (shift_typ is not None and shift_typ.setter is shift_base_type_setter and field.name not in handlers
+                and isinstance(field.val, field.typ)):
+            setattr(instance, field.name, field.val)
+            continue
+        # Undecorated Any fields are set directly when they have a val
+        if (shift_typ is not None and shift_typ.setter is shift_any_type_setter and field.name not in handlers
+                and field.val is not Missing):
+            setattr(instance, field.name, field.val)
+            continue
+
         try:
             _set_field(field, info)
         except ShiftError as e:
             e = _build_field_error(field.name, e)
-            if info.shift_config.fail_fast:
+            if fail_fast:
                 raise e
-            info.set_errors.append(e)
+            errors.append(e)
 
 
 
 ## Repr
 #######
 
-def _repr_field(field: ShiftFieldInfo, info: ShiftInfo) -> str | None:
+def _repr_field(field: ShiftFieldInfo, info: ShiftInfo, include_private: bool, include_default: bool) -> str | None:
     # If field repr, call
-    if field.name in info.reprs:
-        return str(shift_function_wrapper(field, info, info.reprs[field.name]))
+    handler = info.handlers.get(field.name)
+    if handler is not None and handler.repr is not None:
+        return str(shift_function_wrapper(field, info, handler.repr))
 
     # If field name is private and config set to exclude, return
-    if field.name.startswith("_") and not info.shift_config.include_private_fields_in_serialization:
+    if not include_private and field.is_private:
         return None
 
     # If field is default value and config set to exclude, return default value repr
-    if field.val == field.default and not info.shift_config.include_default_fields_in_serialization:
+    if not include_default and (field.val is field.default or field.val == field.default):
         return None
 
     # Run type repr
@@ -2211,24 +2582,49 @@ def _repr_field(field: ShiftFieldInfo, info: ShiftInfo) -> str | None:
 
 def _repr(info: ShiftInfo) -> str:
     result: list[str] = []
-    if info.shift_config.include_private_fields_in_serialization and (info.shift_config != DEFAULT_SHIFT_CONFIG or info.shift_config.include_default_fields_in_serialization):
-        result.append(f"__shift_config__={repr(info.shift_config)}")
+    _sync_config_output(info)
+    if info.config_repr is not None:
+        result.append(f"__shift_config__={info.config_repr}")
+    append = result.append
+    include_private = info.shift_config.include_private_fields_in_serialization
+    include_default = info.shift_config.include_default_fields_in_serialization
+    handlers = _sync_shift_info(info)
+
+    # Simple classes only hold base type fields, so repr the vals directly
+    if info.simple_output:
+        for field in info.fields:
+            if not include_private and field.is_private:
+                continue
+            val = field.val
+            if not include_default and (val is field.default or val == field.default):
+                continue
+            # Let the type repr raise the mismatch error
+            append(f"{field.name}={repr(val) if isinstance(val, field.typ) else shift_base_type_repr(info.instance, field, info)}")
+        return f"{info.model_name}({', '.join(result)})"
+
+    instance = info.instance
     for field in info.fields:
-        res = (_repr_field(field, info))
+        # Undecorated fields are filtered inline instead of going through _repr_field
+        if field.name in handlers:
+            res = _repr_field(field, info, include_private, include_default)
+        else:
+            if not include_private and field.is_private:
+                continue
+            val = field.val
+            if not include_default and (val is field.default or val == field.default):
+                continue
+            res = shift_type_repr(instance, field, info)
+        if res is None:
+            continue
 
         # Handle field name
-        if res is not None and isinstance(field.default, ShiftField):
-            if field.default.repr_exclude:
+        default = field.default
+        if isinstance(default, ShiftField):
+            if default.repr_exclude:
                 continue
-            if field.default.repr_as:
-                res = f"{field.default.repr_as}={res}"
-            else:
-                res = f"{field.name}={res}"
-        elif res is not None:
-            res = f"{field.name}={res}"
-
-        if res is not None:
-            result.append(res)
+            append(f"{default.repr_as or field.name}={res}")
+        else:
+            append(f"{field.name}={res}")
     return f"{info.model_name}({', '.join(result)})"
 
 
@@ -2236,17 +2632,18 @@ def _repr(info: ShiftInfo) -> str:
 ## Serialize
 ############
 
-def _serialize_field(field: ShiftFieldInfo, info: ShiftInfo) -> Any | Missing:
+def _serialize_field(field: ShiftFieldInfo, info: ShiftInfo, include_private: bool, include_default: bool) -> Any | Missing:
     # If field serializer, call
-    if field.name in info.serializers:
-        return shift_function_wrapper(field, info, info.serializers[field.name])
+    handler = info.handlers.get(field.name)
+    if handler is not None and handler.serializer is not None:
+        return shift_function_wrapper(field, info, handler.serializer)
 
     # If field name is private and config set to exclude, return
-    if field.name.startswith("_") and not info.shift_config.include_private_fields_in_serialization:
+    if not include_private and field.is_private:
         return Missing
 
     # If field is default value and config set to exclude, return default value repr
-    if field.val == field.default and not info.shift_config.include_default_fields_in_serialization:
+    if not include_default and (field.val is field.default or field.val == field.default):
         return Missing
 
     # Run type serializer
@@ -2254,24 +2651,48 @@ def _serialize_field(field: ShiftFieldInfo, info: ShiftInfo) -> Any | Missing:
 
 def _serialize(info: ShiftInfo) -> dict:
     result = {}
-    if info.shift_config.include_private_fields_in_serialization and (info.shift_config != DEFAULT_SHIFT_CONFIG or info.shift_config.include_default_fields_in_serialization):
-        result["__shift_config__"] = serialize(info.shift_config)
+    _sync_config_output(info)
+    if info.config_serialized is not None:
+        result["__shift_config__"] = info.config_serialized.copy()
+    include_private = info.shift_config.include_private_fields_in_serialization
+    include_default = info.shift_config.include_default_fields_in_serialization
+    handlers = _sync_shift_info(info)
+
+    # Simple classes only hold base type fields, so serialize the vals directly
+    if info.simple_output:
+        for field in info.fields:
+            if not include_private and field.is_private:
+                continue
+            val = field.val
+            if not include_default and (val is field.default or val == field.default):
+                continue
+            # Let the type serializer raise the mismatch error
+            result[field.name] = val if isinstance(val, field.typ) else shift_base_type_serializer(info.instance, field, info)
+        return result
+
+    instance = info.instance
     for field in info.fields:
-        res = _serialize_field(field, info)
+        # Undecorated fields are filtered inline instead of going through _serialize_field
+        if field.name in handlers:
+            res = _serialize_field(field, info, include_private, include_default)
+        else:
+            if not include_private and field.is_private:
+                continue
+            val = field.val
+            if not include_default and (val is field.default or val == field.default):
+                continue
+            res = shift_type_serializer(instance, field, info)
+        if res is Missing:
+            continue
 
         # Handle field name
-        if res is not Missing and isinstance(field.default, ShiftField):
-            if field.default.serializer_exclude:
+        default = field.default
+        if isinstance(default, ShiftField):
+            if default.serializer_exclude:
                 continue
-            if field.default.serialize_as:
-                res = {field.default.serialize_as: res}
-            else:
-                res = {field.name: res}
-        elif res is not Missing:
-            res = {field.name: res}
-
-        if res is not Missing:
-            result.update(res)
+            result[default.serialize_as or field.name] = res
+        else:
+            result[field.name] = res
     return result
 
 
@@ -2327,27 +2748,34 @@ def get_field_decorators(cls: Any, fields: dict) -> dict[str, list[AnyShiftDecor
     }
 
     # Find and process decorators in fields
-    for field_name in fields.keys():
+    for name, val in fields.items():
         # Skip magic fields
-        if field_name.startswith("__") and field_name.endswith("__"):
+        if name.startswith("__") and name.endswith("__"):
             continue
 
-        # Get value
-        try:
-            val = getattr(cls, field_name, Missing)
-        except AttributeError:
+        # Read decorator markers straight from the function dict, unwrapping static and class methods
+        attrs = getattr(getattr(val, "__func__", val), "__dict__", None)
+        if not attrs:
+            continue
+        transformer_for = attrs.get('__shift_transformer_for__')
+        validator_for = attrs.get('__shift_validator_for__')
+        setter_for = attrs.get('__shift_setter_for__')
+        repr_for = attrs.get('__shift_repr_for__')
+        serializer_for = attrs.get('__shift_serializer_for__')
+        if transformer_for is None and validator_for is None and setter_for is None and repr_for is None and serializer_for is None:
             continue
 
-        # Skip non-callable fields
-        if not inspect.ismethod(val) and not inspect.isfunction(val) and not callable(val):
+        # Get value as the class exposes it
+        try:
+            val = getattr(cls, name)
+        except AttributeError:
             continue
 
         # If transformer, check if pre and if skip, add
-        if hasattr(val, '__shift_transformer_for__'):
-            field_names = val.__shift_transformer_for__
-            pre = getattr(val, '__shift_transformer_pre__', False)
-            skip = getattr(val, '__shift_transformer_skip__', False)
-            for field_name in field_names:
+        if transformer_for is not None:
+            pre = attrs.get('__shift_transformer_pre__', False)
+            skip = attrs.get('__shift_transformer_skip__', False)
+            for field_name in transformer_for:
                 if pre:
                     dct["pre_transformers"][field_name] = val
                     if skip:
@@ -2356,11 +2784,10 @@ def get_field_decorators(cls: Any, fields: dict) -> dict[str, list[AnyShiftDecor
                     dct["transformers"][field_name] = val
 
         # If validator, check if pre and if skip, add
-        if hasattr(val, '__shift_validator_for__'):
-            field_names = val.__shift_validator_for__
-            pre = getattr(val, '__shift_validator_pre__', False)
-            skip = getattr(val, '__shift_validator_skip__', False)
-            for field_name in field_names:
+        if validator_for is not None:
+            pre = attrs.get('__shift_validator_pre__', False)
+            skip = attrs.get('__shift_validator_skip__', False)
+            for field_name in validator_for:
                 if pre:
                     dct["pre_validators"][field_name] = val
                     if skip:
@@ -2369,21 +2796,18 @@ def get_field_decorators(cls: Any, fields: dict) -> dict[str, list[AnyShiftDecor
                     dct["validators"][field_name] = val
 
         # If setter, add
-        if hasattr(val, '__shift_setter_for__'):
-            field_names = val.__shift_setter_for__
-            for field_name in field_names:
+        if setter_for is not None:
+            for field_name in setter_for:
                 dct["setters"][field_name] = val
 
         # If repr, add
-        if hasattr(val, '__shift_repr_for__'):
-            field_names = val.__shift_repr_for__
-            for field_name in field_names:
+        if repr_for is not None:
+            for field_name in repr_for:
                 dct["reprs"][field_name] = val
 
         # If serializer, add
-        if hasattr(val, '__shift_serializer_for__'):
-            field_names = val.__shift_serializer_for__
-            for field_name in field_names:
+        if serializer_for is not None:
+            for field_name in serializer_for:
                 dct["serializers"][field_name] = val
 
     # Return decorators dict
@@ -2393,10 +2817,13 @@ def get_fields(cls: Any, fields: dict, data: dict, shift_config: ShiftConfig = D
     shift_fields: list[ShiftFieldInfo] = []
 
     # Get all annotated fields - use try because forward references break get_type_hints
-    try:
-        annotated = get_type_hints(cls)
-    except NameError:
-        annotated = cls.__annotations__.copy() if hasattr(cls, "__annotations__") else {}
+    annotated = _type_hints_cache.get(cls)
+    if annotated is None:
+        try:
+            annotated = get_type_hints(cls)
+        except NameError:
+            annotated = cls.__annotations__.copy() if hasattr(cls, "__annotations__") else {}
+        _type_hints_cache[cls] = annotated
 
     for field_name, field_type in annotated.items():
         # Skip magic fields
@@ -2410,9 +2837,7 @@ def get_fields(cls: Any, fields: dict, data: dict, shift_config: ShiftConfig = D
             continue
 
         # Get val from data if exists
-        val = Missing
-        if field_name in data:
-            val = data[field_name]
+        val = data.get(field_name, Missing)
 
         # If field is private, has a data-set value, and allow setting is false, throw
         if field_name.startswith("_") and val is not Missing and not shift_config.allow_private_field_setting:
@@ -2430,11 +2855,11 @@ def get_fields(cls: Any, fields: dict, data: dict, shift_config: ShiftConfig = D
                 continue
 
             default.type = field_type
-            shift_fields.append(ShiftFieldInfo(name=field_name, typ=ShiftField, val=val, default=default))
+            shift_fields.append(ShiftFieldInfo(name=field_name, typ=ShiftField, val=val, default=default, shift_type=get_shift_type(ShiftField)))
             continue
 
         # Add to shift_fields list
-        shift_fields.append(ShiftFieldInfo(name=field_name, typ=field_type, val=val, default=default))
+        shift_fields.append(ShiftFieldInfo(name=field_name, typ=field_type, val=val, default=default, shift_type=get_shift_type(field_type)))
 
     # Get all non-annotated fields
     for field_name in fields.keys():
@@ -2457,13 +2882,11 @@ def get_fields(cls: Any, fields: dict, data: dict, shift_config: ShiftConfig = D
             continue
 
         # Get val from data if exists
-        val = Missing
-        if field_name in data:
-            val = data[field_name]
+        val = data.get(field_name, Missing)
 
-            # If field is private, has a data-set value, and allow setting is false, throw
-            if field_name.startswith("_") and val is not Missing and not shift_config.allow_private_field_setting:
-                raise ShiftFieldError(cls.__name__, f"{field_name} has a set value in data, but allow_private_field_setting is False")
+        # If field is private, has a data-set value, and allow setting is false, throw
+        if field_name.startswith("_") and val is not Missing and not shift_config.allow_private_field_setting:
+            raise ShiftFieldError(cls.__name__, f"{field_name} has a set value in data, but allow_private_field_setting is False")
 
         # If field is private and no default is set, add an implicit None default
         if field_name.startswith('_') and default is Missing:
@@ -2475,85 +2898,92 @@ def get_fields(cls: Any, fields: dict, data: dict, shift_config: ShiftConfig = D
             if default.defer:
                 continue
 
-            shift_fields.append(ShiftFieldInfo(name=field_name, typ=ShiftField, val=val, default=default))
+            shift_fields.append(ShiftFieldInfo(name=field_name, typ=ShiftField, val=val, default=default, shift_type=get_shift_type(ShiftField)))
             continue
 
         # Add to shift_fields list
-        shift_fields.append(ShiftFieldInfo(name=field_name, val=val, default=default))
+        shift_fields.append(ShiftFieldInfo(name=field_name, val=val, default=default, shift_type=get_shift_type(Missing)))
 
     # Return shift_fields list
     return shift_fields
 
-def get_updated_fields(instance: Any, fields: list[ShiftFieldInfo], data: dict, shift_config: ShiftConfig = DEFAULT_SHIFT_CONFIG) -> list[ShiftFieldInfo]:
-    updated_fields = []
-    for field in fields:
-        # If name is private, a data val is present, and allow setting is false, throw
-        if field.name.startswith("_") and field.name in data and not shift_config.allow_private_field_setting:
-            raise ShiftFieldError(field.name, f"has a set value in data, but allow_private_field_setting is False")
-
-        new_val = data.get(field.name, field.default)
-
-        # If val is a ShiftField, set default to new_val and val to Missing
-        if isinstance(new_val, ShiftField):
-            updated_fields.append(ShiftFieldInfo(
-                name=field.name,
-                typ=field.typ,
-                val=Missing,
-                default=new_val
-            ))
-            continue
-
-        # Create a new ShiftFieldInfo instead of mutating the cached one
-        updated_fields.append(ShiftFieldInfo(
-            name=field.name,
-            typ=field.typ,
-            val=new_val,
-            default=field.default
-        ))
-    return updated_fields
+def get_updated_fields(instance: Any, fields: list[ShiftFieldInfo], data: dict, shift_config: ShiftConfig = DEFAULT_SHIFT_CONFIG, private_field_names: frozenset[str] | None = None) -> list[ShiftFieldInfo]:
+    # If a private field has a data val and allow setting is false, throw
+    if data and not shift_config.allow_private_field_setting:
+        if private_field_names is None:
+            private_field_names = frozenset(field.name for field in fields if field.is_private)
+        private_data = data.keys() & private_field_names
+        if private_data:
+            field_name = next(field.name for field in fields if field.name in private_data)
+            raise ShiftFieldError(field_name, f"has a set value in data, but allow_private_field_setting is False")
+
+    # Create new ShiftFieldInfos instead of mutating the cached ones
+    #   If the val is a ShiftField, set default to the val and val to Missing
+    data_get = data.get
+    return [
+        ShiftFieldInfo(field.name, field.typ, Missing, val, field.shift_type)
+        if isinstance(val := data_get(field.name, field.default), ShiftField)
+        else ShiftFieldInfo(field.name, field.typ, val, field.default, field.shift_type)
+        for field in fields
+    ]
+
+# Sentinel for attributes an instance doesn't have, Missing can't be used since it's a valid attribute value
+_no_attr = object()
 
 def get_val_fields(instance: Any, fields: list[ShiftFieldInfo]) -> list[ShiftFieldInfo]:
     val_fields = []
+    append = val_fields.append
     for field in fields:
-        if hasattr(instance, field.name):
-            # Create a shallow copy to prevent modification of original values
-            val = getattr(instance, field.name)
-            val = copy.copy(val) if hasattr(val, '__copy__') else val
-            val_fields.append(ShiftFieldInfo(
-                name=field.name,
-                typ=field.typ,
-                val=val,
-                default=field.default
-            ))
+        # Read the val with a single lookup, skipping fields the instance doesn't have
+        val = getattr(instance, field.name, _no_attr)
+        if val is _no_attr:
+            continue
+
+        # Create a shallow copy to prevent modification of original values
+        if _has_copy(val):
+            val = copy.copy(val)
+        append(ShiftFieldInfo(field.name, field.typ, val, field.default, field.shift_type))
     return val_fields
 
+def _copy_shift_info(cached_info: ShiftInfo, instance: Any, data: dict, fields: list[ShiftFieldInfo]) -> ShiftInfo:
+    """Builds a new ShiftInfo for instance that shares all per-class data with cached_info"""
+    return ShiftInfo(
+        instance=instance,
+        model_name=cached_info.model_name,
+        shift_config=cached_info.shift_config,
+        fields=fields,
+        pre_transformer_skips=cached_info.pre_transformer_skips,
+        pre_transformers=cached_info.pre_transformers,
+        transformers=cached_info.transformers,
+        pre_validator_skips=cached_info.pre_validator_skips,
+        pre_validators=cached_info.pre_validators,
+        validators=cached_info.validators,
+        setters=cached_info.setters,
+        reprs=cached_info.reprs,
+        serializers=cached_info.serializers,
+        data=data,
+        transform_errors=[],
+        validation_errors=[],
+        set_errors=[],
+        handlers=cached_info.handlers,
+        handlers_source=cached_info.handlers_source,
+        # fields is derived from cached_info.fields, so it keeps the same layout
+        fields_source=fields if cached_info.fields is cached_info.fields_source else None,
+        private_field_names=cached_info.private_field_names,
+        config_repr=cached_info.config_repr,
+        config_serialized=cached_info.config_serialized,
+        config_source=cached_info.config_source,
+        simple_output=cached_info.simple_output
+    )
+
 # noinspection PyTypeChecker
 def get_shift_info(cls: Any, instance: Any, data: dict) -> ShiftInfo:
     # If cls is in model_info, return copy so non-persistent data is not kept
-    if cls in _shift_info_registry:
-        cached_info = _shift_info_registry[cls]
-        # Build new copied info
-        info = ShiftInfo(
-            instance=instance,
-            model_name=cached_info.model_name,
-            shift_config=cached_info.shift_config,
-            # This always needs to be updated with the new data
-            fields=get_updated_fields(instance, cached_info.fields, data, cached_info.shift_config),
-            pre_transformer_skips=cached_info.pre_transformer_skips,
-            pre_transformers=cached_info.pre_transformers,
-            transformers=cached_info.transformers,
-            pre_validator_skips=cached_info.pre_validator_skips,
-            pre_validators=cached_info.pre_validators,
-            validators=cached_info.validators,
-            setters=cached_info.setters,
-            reprs=cached_info.reprs,
-            serializers=cached_info.serializers,
-            data=data,
-            transform_errors=[],
-            validation_errors=[],
-            set_errors=[]
-        )
-        return info
+    cached_info = _shift_info_registry.get(cls)
+    if cached_info is not None:
+        # Fields always need to be updated with the new data
+        return _copy_shift_info(cached_info, instance, data, get_updated_fields(
+            instance, cached_info.fields, data, cached_info.shift_config, cached_info.private_field_names))
 
     # Else build new info and add to model_info
     ## Get all fields (annotated, non-annotated, functions, etc
@@ -2562,6 +2992,10 @@ def get_shift_info(cls: Any, instance: Any, data: dict) -> ShiftInfo:
     shift_config = get_shift_config(cls, cls_dict)
     shift_fields = get_fields(cls, cls_dict, data, shift_config)
     decorators = get_field_decorators(cls, cls_dict)
+    ## Resolve whether the config is part of repr/serialize output once
+    config_repr, config_serialized = _build_config_output(shift_config)
+    ## Build the per-field decorator handlers
+    handlers = _build_field_handlers(decorators)
     ## Build info class
     info = ShiftInfo(
         instance=instance,
@@ -2580,13 +3014,30 @@ def get_shift_info(cls: Any, instance: Any, data: dict) -> ShiftInfo:
         data=data,
         transform_errors=[],
         validation_errors=[],
-        set_errors=[]
+        set_errors=[],
+        handlers=handlers,
+        handlers_source=tuple(decorators[key].copy() for key in _decorator_keys),
+        fields_source=shift_fields,
+        private_field_names=frozenset(field.name for field in shift_fields if field.is_private),
+        config_repr=config_repr,
+        config_serialized=config_serialized,
+        config_source=copy.copy(shift_config),
+        simple_output=_is_simple_output(shift_fields, handlers)
     )
 
     # Register info and return it
     _shift_info_registry[cls] = info
     return info
 
+def _get_val_shift_info(cls: Any, instance: Any) -> ShiftInfo:
+    """Same as get_shift_info with no data, but fields are built once from the current vals of instance"""
+    cached_info = _shift_info_registry.get(cls)
+    if cached_info is None:
+        info = get_shift_info(cls, instance, {})
+        info.fields = get_val_fields(instance, info.fields)
+        return info
+    return _copy_shift_info(cached_info, instance, {}, get_val_fields(instance, cached_info.fields))
+
 
 
 ## Classes
@@ -2597,11 +3048,13 @@ class ShiftModel:
 
     def __init__(self, **data):
         # Get shift info
-        info = get_shift_info(self.__class__, self, data)
+        cls = self.__class__
+        cls_dict = cls.__dict__
+        info = get_shift_info(cls, self, data)
 
         # If cls has __pre_init__(), call
-        if "__pre_init__" in self.__class__.__dict__:
-            shift_init_function_wrapper(info, self.__class__.__dict__["__pre_init__"])
+        if "__pre_init__" in cls_dict:
+            shift_init_function_wrapper(info, cls_dict["__pre_init__"])
 
         # Run transform, validation, and set processes
         if info.shift_config.do_processing:
@@ -2610,8 +3063,8 @@ class ShiftModel:
             self.set(info)
 
         # If cls has __post_init__(), call
-        if "__post_init__" in self.__class__.__dict__:
-            shift_init_function_wrapper(info, self.__class__.__dict__["__post_init__"])
+        if "__post_init__" in cls_dict:
+            shift_init_function_wrapper(info, cls_dict["__post_init__"])
 
 
 
@@ -2624,7 +3077,7 @@ class ShiftModel:
         _transform(info)
 
         # Check for errors
-        if len(info.transform_errors):
+        if info.transform_errors:
             raise ShiftModelError(self.__class__.__name__, 'transform', info.transform_errors)
 
     def validate(self, info: ShiftInfo=None, **data) -> bool:
@@ -2633,7 +3086,7 @@ class ShiftModel:
             info = get_shift_info(self.__class__, self, data)
 
         # Run validation, throw if fail
-        if not _validate(info) or len(info.validation_errors):
+        if not _validate(info) or info.validation_errors:
             raise ShiftModelError(self.__class__.__name__, 'validation', info.validation_errors)
         return True
 
@@ -2646,46 +3099,92 @@ class ShiftModel:
         _set(info)
 
         # Check for errors
-        if len(info.set_errors):
+        if info.set_errors:
             raise ShiftModelError(self.__class__.__name__, 'set', info.set_errors)
 
     def __repr__(self, info: ShiftInfo=None) -> str:
-        # Get shift info if not provided
+        # Get shift info with current vals if not provided
         if info is None:
-            info = get_shift_info(self.__class__, self, {})
-
-        # Get fields with current values
-        info.fields = get_val_fields(self, info.fields)
+            info = _get_val_shift_info(self.__class__, self)
+        else:
+            info.fields = get_val_fields(self, info.fields)
 
         # Run repr process
         return _repr(info)
 
     def serialize(self, info: ShiftInfo=None) -> dict[str, Any]:
-        # Get shift info if not provided
+        # Get shift info with current vals if not provided
         if info is None:
-            info = get_shift_info(self.__class__, self, {})
-
-        # Get fields with current values
-        info.fields = get_val_fields(self, info.fields)
+            info = _get_val_shift_info(self.__class__, self)
+        else:
+            info.fields = get_val_fields(self, info.fields)
 
         # Run serialization process
         return _serialize(info)
 
+    def to_json(self) -> bytes:
+        """Returns the serialized instance as UTF-8 JSON bytes, using orjson when installed
+
+        NaN and infinite floats are written as null by orjson, but raise ValueError with the json fallback
+        """
+        if orjson is not None:
+            return orjson.dumps(self.serialize(), option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.serialize(), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> list[Any]:
+        """Returns a list of instances, one per record, built as cls(**record)"""
+        # The first record registers the class, every following record takes the cached ShiftInfo path
+        return [cls(**record) for record in records]
+
 
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
+
+        # Simple classes serialize their vals as-is, so compare the vals directly instead of building both dicts
+        info = _shift_info_registry.get(self.__class__)
+        if info is not None and info.simple_output and other.__class__ is self.__class__:
+            include_private = info.shift_config.include_private_fields_in_serialization
+            include_default = info.shift_config.include_default_fields_in_serialization
+            for field in info.fields:
+                if not include_private and field.is_private:
+                    continue
+                val = getattr(self, field.name, _no_attr)
+                other_val = getattr(other, field.name, _no_attr)
+                # Default vals are left out of serialize, so treat them like missing vals
+                if not include_default:
+                    default = field.default
+                    if val is default or val == default:
+                        val = _no_attr
+                    if other_val is default or other_val == default:
+                        other_val = _no_attr
+                if val is not other_val and val != other_val:
+                    return False
+            return True
+
         return self.serialize() == other.serialize()
 
     def __ne__(self, other: Any) -> bool:
         return not self == other
 
     def __hash__(self) -> int:
-        return hash(tuple(sorted(self.serialize().items())))
+        return hash(_freeze(self.serialize()))
 
     def __copy__(self) -> Any:
-        return type(self)(**self.serialize())
+        # Vals were already processed when self was made, so copy them over without re-running init
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        return new
+
+    def __deepcopy__(self, memo: dict) -> Any:
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return new
 
 
 
@@ -2704,16 +3203,23 @@ def get_shift_type_registry() -> dict[Type, ShiftType]:
 def register_shift_type(typ: Type, shift_type: ShiftType) -> None:
     """Registers a shift type"""
     _shift_types[typ] = shift_type
+    # Cached infos hold resolved shift types per field, so they need to be rebuilt
+    _shift_type_cache.clear()
+    _shift_info_registry.clear()
 
 def deregister_shift_type(typ: Type) -> None:
     """Deregisters a shift type"""
     if typ not in _shift_types:
         raise ShiftFieldError("<module>", f"Type `{typ}` is not registered")
     del _shift_types[typ]
+    _shift_type_cache.clear()
+    _shift_info_registry.clear()
 
 def clear_shift_types() -> None:
     """Clears all registered shift types"""
     _shift_types.clear()
+    _shift_type_cache.clear()
+    _shift_info_registry.clear()
 
 
 
@@ -2825,6 +3331,7 @@ _shift_builtin_types: dict[Type, ShiftType] = {
     dict: all_of_pair_shift_type,
 
     Union: one_of_shift_type,
+    UnionType: one_of_shift_type,
     Optional: one_of_shift_type,
 
     Literal: one_of_val_shift_type,
@@ -2848,13 +3355,17 @@ def reset_starshift_globals() -> None:
     """Reset all global registers and values"""
     _shift_types.clear()
     _shift_types.update(_shift_builtin_types)
+    _shift_type_cache.clear()
     _resolved_forward_refs.clear()
+    _type_origins_cache.clear()
+    _type_args_cache.clear()
+    _type_hints_cache.clear()
+    _type_has_copy_cache.clear()
     _shift_info_registry.clear()
     _shift_functions.clear()
 
     # Re-use existing default config to avoid val vs ref errors
     global DEFAULT_SHIFT_CONFIG
-    DEFAULT_SHIFT_CONFIG.verbosity = 0
     DEFAULT_SHIFT_CONFIG.do_processing = True
     DEFAULT_SHIFT_CONFIG.fail_fast = False
     DEFAULT_SHIFT_CONFIG.try_coerce_types = False
@@ -2867,8 +3378,9 @@ def resolve_forward_ref(typ: str | ForwardRef, info: ShiftInfo) -> Type:
         typ = typ.__forward_arg__
 
     # Check if already resolved
-    if typ in _resolved_forward_refs:
-        return _resolved_forward_refs[typ]
+    resolved = _resolved_forward_refs.get(typ)
+    if resolved is not None:
+        return resolved
 
     # Check if typ is the current class
     if typ == info.model_name:
@@ -2893,7 +3405,6 @@ def resolve_forward_ref(typ: str | ForwardRef, info: ShiftInfo) -> Type:
         pass
 
     # Check builtins
-    import builtins
     if hasattr(builtins, typ):
         resolved = getattr(builtins, typ)
         _resolved_forward_refs[typ] = resolved
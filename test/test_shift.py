@@ -3,7 +3,10 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 from starshift.star_shift import *
+import starshift.star_shift as star_shift_module
 from abc import ABC, abstractmethod
+import json
+import copy
 
 
 
@@ -91,6 +94,80 @@ def test_shift_serialize():
     test = Test()
     assert test.serialize() == {}
 
+def test_shift_to_json(monkeypatch):
+    class Test(ShiftModel):
+        val: int = 42
+        vals: dict[int, str] = {}
+
+    test = Test(val=81, vals={1: "a", 2: "é"})
+    assert isinstance(test.to_json(), bytes)
+    assert json.loads(test.to_json()) == {"val": 81, "vals": {"1": "a", "2": "é"}}
+
+    # The json fallback must produce the same bytes as orjson
+    json_bytes = test.to_json()
+    monkeypatch.setattr(star_shift_module, "orjson", None)
+    assert test.to_json() == json_bytes == '{"val":81,"vals":{"1":"a","2":"é"}}'.encode("utf-8")
+
+    class Test(ShiftModel):
+        val: float
+
+    with pytest.raises(ValueError):
+        Test(val=float("nan")).to_json()
+
+def test_shift_eq_hash():
+    class Test(ShiftModel):
+        val: int = 42
+        vals: list[int] = []
+
+    test_1 = Test(val=81, vals=[1, 2])
+    test_2 = Test(val=81, vals=[1, 2])
+    assert test_1 == test_1
+    assert test_1 == test_2
+    assert hash(test_1) == hash(test_2)
+    assert test_1 != Test(val=81, vals=[2, 1])
+
+    class Test(ShiftModel):
+        vals: dict[str, dict[str, int]] = {}
+
+    test_1 = Test(vals={"a": {"x": 1, "y": 2}, "b": {}})
+    test_2 = Test(vals={"b": {}, "a": {"y": 2, "x": 1}})
+    assert test_1 == test_2
+    assert hash(test_1) == hash(test_2)
+
+    class Test(ShiftModel):
+        val: int = 42
+        _val: int = 0
+
+    test = Test()
+    test._val = 1
+    assert Test() == Test(val=42)
+    assert Test() == test
+    assert Test() != Test(val=81)
+
+def test_shift_copy():
+    class Test(ShiftModel):
+        val: int = 42
+        vals: list[int] = []
+
+    test = Test(val=81, vals=[1, 2])
+    test_copy = copy.copy(test)
+    assert test_copy == test
+    assert test_copy is not test
+    assert test_copy.vals is test.vals
+
+    test_copy = copy.deepcopy(test)
+    assert test_copy == test
+    assert test_copy.vals is not test.vals
+
+def test_shift_from_records():
+    class Test(ShiftModel):
+        val: int = 42
+
+    tests = Test.from_records([{"val": 81}, {}])
+    assert [test.val for test in tests] == [81, 42]
+    with pytest.raises(ShiftModelError):
+        Test.from_records([{"val": 81}, {"val": InvalidType}])
+
 def test_pre_init():
     class Test(ShiftModel):
         val: int = 42
@@ -111,6 +188,63 @@ def test_pre_init():
     test = Test()
     assert test.val == 42
 
+    class Test(ShiftModel):
+        val: int = 42
+
+        def __pre_init__(self, info: ShiftInfo):
+            info.validators = {"val": lambda self, val: False}
+
+    with pytest.raises(ShiftModelError):
+        Test()
+
+    class Test(ShiftModel):
+        val: int = 42
+
+        def __pre_init__(self, info: ShiftInfo):
+            info.validators["val"] = lambda self, val: False
+
+    with pytest.raises(ShiftModelError):
+        Test()
+
+    class Test(ShiftModel):
+        val: int = 42
+
+        def __pre_init__(self, info: ShiftInfo):
+            info.reprs = {"val": lambda self, val: "hidden"}
+
+        def __post_init__(self, info: ShiftInfo):
+            self.val_repr = self.__repr__(info)
+
+    assert Test().val_repr == "Test(val=hidden)"
+
+    class Test(ShiftModel):
+        val: int = 42
+
+        def __pre_init__(self, info: ShiftInfo):
+            info.fields = [ShiftFieldInfo("vals", list[int], [1, 2], [])]
+
+        def __post_init__(self, info: ShiftInfo):
+            self.val_repr = self.__repr__(info)
+            self.val_serialized = self.serialize(info)
+
+    test = Test()
+    assert test.val_repr == "Test(vals=[1, 2])"
+    assert test.val_serialized == {"vals": [1, 2]}
+
+    class Test(ShiftModel):
+        _val: int = 42
+
+        def __pre_init__(self, info: ShiftInfo):
+            info.shift_config = ShiftConfig(include_private_fields_in_serialization=True, include_default_fields_in_serialization=True)
+
+        def __post_init__(self, info: ShiftInfo):
+            self.val_repr = self.__repr__(info)
+            self.val_serialized = self.serialize(info)
+
+    test = Test()
+    assert test.val_repr == "Test(__shift_config__=ShiftConfig(include_default_fields_in_serialization=True, include_private_fields_in_serialization=True), _val=42)"
+    assert test.val_serialized == {"__shift_config__": {"include_default_fields_in_serialization": True, "include_private_fields_in_serialization": True}, "_val": 42}
+
 def test_post_init():
     class Test(ShiftModel):
         val: int = 42
@@ -326,6 +326,20 @@ def test_union():
     with pytest.raises(ShiftError):
         _ = Test(**{"val": InvalidType})
 
+def test_union_arg_order():
+    class Sub(ShiftModel):
+        val: int
+
+    class First(ShiftModel):
+        val: Union[Sub, dict]
+
+    class Second(ShiftModel):
+        val: Union[dict, Sub]
+
+    # Unions with the same args in a different order compare equal, but arg order decides which type is used
+    assert isinstance(First(val={"val": 42}).val, Sub)
+    assert type(Second(val={"val": 42}).val) is dict
+
 def test_optional():
     class Test(ShiftModel):
         val: Optional[int]
@@ -344,6 +358,23 @@ def test_optional():
     test = Test(**{})
     assert test.val is None
 
+def test_union_type():
+    class Test(ShiftModel):
+        val: int | None
+
+    test = Test(val=42)
+    assert test.val == 42
+    assert repr(test) == "Test(val=42)"
+    assert serialize(test) == {"val": 42}
+
+    test = Test()
+    assert test.val is None
+    assert repr(test) == "Test(val=None)"
+    assert serialize(test) == {"val": None}
+
+    with pytest.raises(ShiftError):
+        _ = Test(val=InvalidType)
+
 def test_literal():
     class Test(ShiftModel):
         val: Literal["hello there", "I have a bad feeling about this"]
@@ -16,8 +16,6 @@ def reset_starshift():
 
 
 
-# Can't test log_verbose because it prints
-
 def test_get_shift_type():
     shift_types = get_shift_type_registry()
     int_type = shift_types[int]
@@ -89,6 +87,13 @@ def test_get_field_decorators():
         }
     }
     assert get_field_decorators(Test, Test.__dict__.copy()) == field_decorators
+    assert get_shift_info(Test, Test(val=42), {}).handlers["val"] == ShiftFieldHandlers(
+        transformer=Test.transform_val,
+        validator=Test.validate_val,
+        setter=Test.set_val,
+        repr=Test.repr_val,
+        serializer=Test.serialize_val
+    )
 
     class Test(ShiftModel):
         val: int
@@ -166,6 +171,13 @@ def test_get_fields():
         ShiftFieldInfo(typ=int, name='val', val=81, default=42)
     ]
     assert get_fields(Test, Test.__dict__.copy(), {"val": 81}) == fields
+    assert get_fields(Test, Test.__dict__.copy(), {})[0].shift_type is get_shift_type(int)
+    assert not get_fields(Test, Test.__dict__.copy(), {})[0].is_private
+
+    class Test(ShiftModel):
+        _val: int = 42
+
+    assert get_fields(Test, Test.__dict__.copy(), {})[0].is_private
 
     class Test(ShiftModel):
         val: int
@@ -189,6 +201,9 @@ def test_get_updated_fields():
     ]
     assert get_updated_fields(test_2, get_fields(Test, Test.__dict__.copy(), {}), {"val": 81}) == fields
 
+    with pytest.raises(ShiftFieldError):
+        get_updated_fields(None, [ShiftFieldInfo('_x', int, default=0)], {'_x': 1})
+
 def test_get_val_fields():
     class Test(ShiftModel):
         val: int
@@ -229,6 +244,17 @@ def test_get_shift_info():
     )
     assert get_shift_info(Test, test, {"val": 42}) == info
 
+def test_get_shift_info_simple_output():
+    class Test(ShiftModel):
+        val: int = 42
+
+    assert get_shift_info(Test, Test(), {}).simple_output
+
+    class Test(ShiftModel):
+        val: list[int] = []
+
+    assert not get_shift_info(Test, Test(), {}).simple_output
+
 def test_serialize():
     class Test(ShiftModel):
         val: int